@@ -5,16 +5,34 @@ This module creates and configures the AI agent that handles
 user interactions and manages data in Pocketbase.
 """
 import logging
+from typing import Optional
 
 from pydantic_ai import Agent
 
 from src.config import settings
 from src.ai.context import AgentDeps
-from src.ai.prompts import build_system_prompt
+from src.ai.prompts import (
+    build_static_instructions,
+    build_volatile_prompt,
+)
 from src.ai import tools
 
 logger = logging.getLogger(__name__)
 
+# Coordinator tools, passed to Agent() in one shot
+TOOL_FUNCS = (
+    tools.list_collections,
+    tools.create_collection,
+    tools.list_records,
+    tools.list_records_batch,
+    tools.create_record,
+    tools.update_record,
+    tools.delete_record,
+    tools.search_memories,
+)
+
+_agent: Optional[Agent[AgentDeps, str]] = None
+
 
 def create_agent() -> Agent[AgentDeps, str]:
     """
@@ -26,38 +44,42 @@ def create_agent() -> Agent[AgentDeps, str]:
     model = settings.get_llm_model()
     logger.info("Creating AI agent with model: %s", model)
 
+    # Static instructions go first so they form a stable cacheable prefix
     agent: Agent[AgentDeps, str] = Agent(
         model=model,
         deps_type=AgentDeps,
+        system_prompt=build_static_instructions(),
+        tools=TOOL_FUNCS,
     )
 
-    # Add dynamic system prompt
+    # Memories are not injected - the agent calls search_memories when needed.
+    # Volatile state is the only dynamic system prompt part.
     @agent.system_prompt
-    async def dynamic_system_prompt(ctx) -> str:
-        """
-        Build dynamic system prompt based on current context.
-
-        This is called by PydanticAI before each request to build
-        the system prompt with current collections and memories.
-        """
+    async def volatile_system_prompt(ctx) -> str:
+        """Volatile tier - collections and workflow state, always last."""
         deps: AgentDeps = ctx.deps
+        return build_volatile_prompt(
+            deps.get_collections_summary(),
+            deps.get_workflow_prompt_context(),
+        )
+
+    logger.info("AI agent created with %d tools", len(TOOL_FUNCS))
+    return agent
 
-        collections_summary = deps.get_collections_summary()
-        memories_summary = deps.get_memories_summary()
 
-        return build_system_prompt(collections_summary, memories_summary)
+def get_agent() -> Agent[AgentDeps, str]:
+    """
+    Get or create the coordinator agent singleton.
 
-    # Register all tools
-    agent.tool(tools.list_collections)
-    agent.tool(tools.create_collection)
-    agent.tool(tools.list_records)
-    agent.tool(tools.create_record)
-    agent.tool(tools.update_record)
-    agent.tool(tools.delete_record)
+    Creation (model resolution, tool schema generation) is deferred
+    until first use, so importing this module stays cheap.
 
-    logger.info("AI agent created with %d tools", 6)
-    return agent
+    Returns:
+        Configured Agent instance
+    """
+    global _agent
 
+    if _agent is None:
+        _agent = create_agent()
 
-# Singleton agent instance
-coordinator_agent = create_agent()
+    return _agent
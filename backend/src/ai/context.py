@@ -5,13 +5,20 @@ AgentContext - data that is available during agent execution
 AgentDeps - dependencies injected into PydanticAI RunContext
 WorkflowContext - workflow state passed to agents
 """
+import hashlib
 from dataclasses import dataclass, field
 from typing import Optional
 
 from fastapi import WebSocket
 
 
-@dataclass
+def _versioned(tag: str, text: str) -> str:
+    """Wrap text in a tag with a short content hash as version marker."""
+    version = hashlib.md5(text.encode("utf-8")).hexdigest()[:8]
+    return f"<{tag} v={version}>\n{text}\n</{tag}>"
+
+
+@dataclass(slots=True)
 class AgentContext:
     """
     Context data available to the agent during execution.
@@ -26,7 +33,7 @@ class AgentContext:
     memories: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowContext:
     """
     Workflow context passed to agents.
@@ -45,7 +52,7 @@ class WorkflowContext:
     shared: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDeps:
     """
     Dependencies injected into PydanticAI agent via RunContext.
@@ -60,27 +67,48 @@ class AgentDeps:
 
     def get_collections_summary(self) -> str:
         """Get a summary of available collections for the system prompt."""
-        if not self.context or not self.context.collections:
+        collections = self.context.collections if self.context else None
+        if not collections:
             return "No collections exist yet."
 
-        lines = []
-        for col in self.context.collections:
-            name = col.get("name", "unknown")
-            schema = col.get("schema", [])
-            fields = [f.get("name", "") for f in schema if f.get("name")]
-            fields_str = ", ".join(fields) if fields else "no fields"
-            lines.append(f"- {name}: {fields_str}")
-
-        return "Existing collections:\n" + "\n".join(lines)
+        return "Existing collections:\n" + self._build_collections_pack(collections)
 
     def get_memories_summary(self) -> str:
         """Get a summary of relevant memories for the system prompt."""
-        if not self.context or not self.context.memories:
+        memories = self.context.memories if self.context else None
+        if not memories:
             return "No relevant memories."
 
-        return "Relevant memories:\n" + "\n".join(
-            f"- {m}" for m in self.context.memories[:10]
-        )
+        return "Relevant memories:\n" + self._build_memory_pack(memories)
+
+    @staticmethod
+    def _build_collections_pack(collections: list[dict]) -> str:
+        """
+        Render collections deterministically.
+
+        Collections are sorted by name and fields alphabetically, so the
+        rendered text (and the prompt prefix) only changes when the
+        collections themselves change.
+        """
+        def line(col: dict) -> str:
+            schema = col.get("schema") or col.get("fields") or ()
+            names = sorted(f["name"] for f in schema if f.get("name"))
+            fields_str = ", ".join(names) if names else "no fields"
+            return f"- {col.get('name', 'unknown')}: {fields_str}"
+
+        ordered = sorted(collections, key=lambda c: c.get("name", ""))
+        return _versioned("collections", "\n".join(line(c) for c in ordered))
+
+    @staticmethod
+    def _build_memory_pack(memories: list[str]) -> str:
+        """
+        Render the top memories deterministically.
+
+        The 10 most relevant memories are kept, then sorted lexically so
+        that search ranking jitter does not reshuffle the prompt.
+        """
+        text = "\n".join(f"- {m}" for m in sorted(memories[:10]))
+        return _versioned("memories", text)
 
     def get_workflow_prompt_context(self) -> str:
         """
@@ -3,23 +3,48 @@ Tools for AI Agent to interact with Pocketbase.
 
 These tools allow the agent to:
 - List/create collections
-- Create/read/update/delete records
+- Create/read/update/delete records (reads can be batched across collections)
+- Search long-term memories about the user
 - Send WebSocket events on changes
 """
+import asyncio
 import logging
 import re
 from typing import Any, Optional
 
+from fastapi import WebSocket
 from pydantic_ai import RunContext
 
 from src.ai.context import AgentDeps
 from src.services.pocketbase import pocketbase, PocketbaseError
 from src.services.connection_manager import manager
+from src.services.memory import get_memory_service
 
 logger = logging.getLogger(__name__)
 
 # System collections that should not be exposed to AI (our app's system collections)
-APP_SYSTEM_COLLECTIONS = {"agents", "conversations", "users"}
+APP_SYSTEM_COLLECTIONS = frozenset({"agents", "conversations", "users"})
+
+# Characters not allowed in Pocketbase collection names
+_NAME_RE = re.compile(r"[^a-z0-9_]")
+
+# Simple field type -> Pocketbase field type. Unknown types fall back to text.
+# - text: plain text
+# - number: numeric value
+# - bool: boolean
+# - select: select from options (options in field definition)
+# - date: date/datetime
+# - json: arbitrary JSON data
+_FIELD_TYPE_MAP = {
+    "text": "text",
+    "number": "number",
+    "bool": "bool",
+    "select": "select",
+    "date": "date",
+    "json": "json",
+    "email": "email",
+    "url": "url",
+}
 
 
 def _normalize_collection_name(name: str) -> str:
@@ -34,48 +59,46 @@ def _normalize_collection_name(name: str) -> str:
     # Convert to lowercase and replace spaces
     normalized = name.lower().strip().replace(" ", "_")
     # Remove non-alphanumeric characters except underscores
-    normalized = re.sub(r"[^a-z0-9_]", "", normalized)
+    normalized = _NAME_RE.sub("", normalized)
     # Ensure it starts with a letter
     if normalized and not normalized[0].isalpha():
         normalized = "c_" + normalized
     return normalized or "collection"
 
 
-def _field_type_to_pocketbase(field_type: str) -> dict:
+def _normalize_field_name(name: str) -> str:
+    """Normalize field name: lowercase, spaces to underscores."""
+    return name.lower().replace(" ", "_")
+
+
+# Strong references to in-flight WS notifications so they are not
+# garbage collected before completion
+_ws_tasks: set[asyncio.Task] = set()
+
+
+async def _deliver_ws_event(websocket: WebSocket, event_type: str, data: dict) -> None:
+    """Deliver WebSocket event to connected client."""
+    try:
+        await manager.send_personal(
+            websocket,
+            {"type": event_type, **data}
+        )
+    except Exception as e:
+        logger.warning("Failed to send WS event: %s", e)
+
+
+def _send_ws_event(deps: AgentDeps, event_type: str, data: dict) -> None:
     """
-    Convert simple field type to Pocketbase schema format.
-
-    Supported types:
-    - text: plain text
-    - number: numeric value
-    - bool: boolean
-    - select: select from options (options in field definition)
-    - date: date/datetime
-    - json: arbitrary JSON data
+    Send WebSocket event to connected client in background.
+
+    The notification is advisory UI state, so the tool returns its result
+    to the model without waiting for the socket write.
     """
-    type_mapping = {
-        "text": {"type": "text"},
-        "number": {"type": "number"},
-        "bool": {"type": "bool"},
-        "select": {"type": "select"},
-        "date": {"type": "date"},
-        "json": {"type": "json"},
-        "email": {"type": "email"},
-        "url": {"type": "url"},
-    }
-    return type_mapping.get(field_type, {"type": "text"})
-
-
-async def _send_ws_event(deps: AgentDeps, event_type: str, data: dict) -> None:
-    """Send WebSocket event to connected client."""
-    if deps.websocket:
-        try:
-            await manager.send_personal(
-                deps.websocket,
-                {"type": event_type, **data}
-            )
-        except Exception as e:
-            logger.warning("Failed to send WS event: %s", e)
+    if not deps.websocket:
+        return
+    task = asyncio.create_task(_deliver_ws_event(deps.websocket, event_type, data))
+    _ws_tasks.add(task)
+    task.add_done_callback(_ws_tasks.discard)
 
 
 # ==================== Tools ====================
@@ -92,15 +115,17 @@ async def list_collections(ctx: RunContext[AgentDeps]) -> list[dict]:
         all_collections = await pocketbase.list_collections()
 
         # Filter out system collections (Pocketbase internal + our app's system collections)
-        user_collections = [
-            {
-                "name": col.get("name"),
-                "fields": col.get("fields", col.get("schema", [])),
-            }
-            for col in all_collections
-            if col.get("name") not in APP_SYSTEM_COLLECTIONS
-            and not col.get("name", "").startswith("_")  # Exclude PB internal collections
-        ]
+        user_collections = []
+        for col in all_collections:
+            name = col.get("name") or ""
+            if name in APP_SYSTEM_COLLECTIONS or name.startswith("_"):
+                continue
+            user_collections.append(
+                {
+                    "name": name,
+                    "fields": col.get("fields") or col.get("schema") or [],
+                }
+            )
 
         logger.info("Listed %d user collections", len(user_collections))
         return user_collections
@@ -127,27 +152,23 @@ async def create_collection(
     Returns:
         Created collection info or error
     """
-    # === DIAGNOSTIC LOGGING ===
-    logger.info("=" * 60)
-    logger.info("CREATE_COLLECTION CALLED")
-    logger.info("Raw arguments received:")
-    logger.info("  name = %r (type: %s)", name, type(name).__name__)
-    logger.info("  fields = %r (type: %s)", fields, type(fields).__name__)
-    if fields:
-        logger.info("  fields length = %d", len(fields))
-        for i, f in enumerate(fields):
-            logger.info("    field[%d] = %r", i, f)
-    else:
-        logger.info("  fields is EMPTY or None!")
-    logger.info("=" * 60)
-    # === END DIAGNOSTIC ===
+    logger.debug(
+        "create_collection name=%s fields=%s",
+        name,
+        [f.get("name") for f in fields] if fields else [],
+    )
 
     normalized_name = _normalize_collection_name(name)
 
     # Build Pocketbase schema
     schema = []
     for field in fields:
-        field_name = field.get("name", "").lower().replace(" ", "_")
+        field_name = _normalize_field_name(field.get("name", ""))
+        if not field_name:
+            return {
+                "success": False,
+                "error": "Every field needs a non-empty name",
+            }
         field_type = field.get("type", "text")
         required = field.get("required", False)
         options = field.get("options", [])
@@ -155,7 +176,7 @@ async def create_collection(
         pb_field = {
             "name": field_name,
             "required": required,
-            **_field_type_to_pocketbase(field_type),
+            "type": _FIELD_TYPE_MAP.get(field_type, "text"),
         }
 
         # Add options for select type
@@ -169,7 +190,7 @@ async def create_collection(
         logger.info("Created collection: %s", normalized_name)
 
         # Send WebSocket event
-        await _send_ws_event(
+        _send_ws_event(
             ctx.deps,
             "collection_created",
             {"collection": {"name": normalized_name, "schema": schema}}
@@ -189,6 +210,24 @@ async def create_collection(
         }
 
 
+async def _list_items(collection: str, filter: Optional[str] = None) -> list[dict]:
+    """Fetch up to 50 records from a collection, empty list on error."""
+    try:
+        result = await pocketbase.list_records(
+            collection=collection,
+            filter=filter,
+            per_page=50,
+        )
+
+        items = result.get("items", [])
+        logger.info("Listed %d records from %s", len(items), collection)
+        return items
+
+    except PocketbaseError as e:
+        logger.error("Failed to list records from %s: %s", collection, e.message)
+        return []
+
+
 async def list_records(
     ctx: RunContext[AgentDeps],
     collection: str,
@@ -204,20 +243,27 @@ async def list_records(
     Returns:
         List of records
     """
-    try:
-        result = await pocketbase.list_records(
-            collection=collection,
-            filter=filter,
-            per_page=50,
-        )
+    return await _list_items(collection, filter)
 
-        items = result.get("items", [])
-        logger.info("Listed %d records from %s", len(items), collection)
-        return items
 
-    except PocketbaseError as e:
-        logger.error("Failed to list records from %s: %s", collection, e.message)
-        return []
+async def list_records_batch(
+    ctx: RunContext[AgentDeps],
+    collections: list[str],
+) -> dict[str, list[dict]]:
+    """
+    List records from several collections at once.
+
+    Prefer this over multiple list_records calls when records from
+    more than one collection are needed.
+
+    Args:
+        collections: Collection names
+
+    Returns:
+        Mapping of collection name to its list of records
+    """
+    results = await asyncio.gather(*(_list_items(c) for c in collections))
+    return dict(zip(collections, results))
 
 
 async def create_record(
@@ -235,26 +281,14 @@ async def create_record(
     Returns:
         Created record or error
     """
-    # === DIAGNOSTIC LOGGING ===
-    logger.info("=" * 60)
-    logger.info("CREATE_RECORD CALLED")
-    logger.info("Raw arguments received:")
-    logger.info("  collection = %r", collection)
-    logger.info("  data = %r (type: %s)", data, type(data).__name__)
-    if data:
-        for k, v in data.items():
-            logger.info("    %s = %r", k, v)
-    else:
-        logger.info("  data is EMPTY!")
-    logger.info("=" * 60)
-    # === END DIAGNOSTIC ===
+    logger.debug("create_record %s keys=%s", collection, list(data) if data else [])
 
     try:
         result = await pocketbase.create_record(collection, data)
         logger.info("Created record in %s: %s", collection, result.get("id"))
 
         # Send WebSocket event
-        await _send_ws_event(
+        _send_ws_event(
             ctx.deps,
             "entity_created",
             {"collection": collection, "entity": result}
@@ -295,7 +329,7 @@ async def update_record(
         logger.info("Updated record %s in %s", record_id, collection)
 
         # Send WebSocket event
-        await _send_ws_event(
+        _send_ws_event(
             ctx.deps,
             "entity_updated",
             {"collection": collection, "entity": result}
@@ -334,7 +368,7 @@ async def delete_record(
         logger.info("Deleted record %s from %s", record_id, collection)
 
         # Send WebSocket event
-        await _send_ws_event(
+        _send_ws_event(
             ctx.deps,
             "entity_deleted",
             {"collection": collection, "entity_id": record_id}
@@ -351,3 +385,24 @@ async def delete_record(
             "success": False,
             "error": e.message,
         }
+
+
+async def search_memories(
+    ctx: RunContext[AgentDeps],
+    query: str,
+    k: int = 5,
+) -> list[str]:
+    """
+    Search long-term memories about the user from past conversations.
+
+    Args:
+        query: What to look for (e.g. "work schedule", "favorite food")
+        k: Maximum number of memories to return
+
+    Returns:
+        List of relevant memory strings
+    """
+    memory_service = get_memory_service(ctx.deps.user_id)
+    memories = await memory_service.search(query, limit=k)
+    logger.info("Found %d memories for query: %s", len(memories), query[:50])
+    return memories
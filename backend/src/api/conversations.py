@@ -1,6 +1,7 @@
 """
 Conversations API endpoints.
 """
+import asyncio
 import logging
 from typing import Optional
 
@@ -51,7 +52,7 @@ async def get_active_conversation(
     if not conversation:
         return None
 
-    return ConversationResponse(
+    return ConversationResponse.model_construct(
         id=conversation.id,
         user_id=conversation.user_id,
         workflow_instance_id=conversation.workflow_instance_id,
@@ -66,21 +67,27 @@ async def get_conversation_with_history(
     limit: int = Query(50, ge=1, le=200),
 ) -> ConversationWithHistory:
     """Get conversation with message history."""
-    # Get messages
-    messages = await conversation_service.get_history(conversation_id, limit)
+    # Messages and conversation record are independent - fetch in parallel
+    messages, conversation = await asyncio.gather(
+        conversation_service.get_history(conversation_id, limit, include_metadata=True),
+        conversation_service.get_conversation(conversation_id),
+    )
 
-    if not messages:
+    if not messages and not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     # Build response
-    return ConversationWithHistory(
-        conversation=ConversationResponse(
+    return ConversationWithHistory.model_construct(
+        conversation=ConversationResponse.model_construct(
             id=conversation_id,
-            user_id="",  # Would need to fetch from first message or conversation record
-            status="active",
+            user_id=conversation.user_id if conversation else "",
+            workflow_instance_id=conversation.workflow_instance_id if conversation else None,
+            agent_name=conversation.agent_name if conversation else None,
+            status=conversation.status if conversation else "active",
         ),
+        # Messages come from Pocketbase already typed - skip validation
         messages=[
-            MessageResponse(
+            MessageResponse.model_construct(
                 id=msg.id,
                 conversation_id=msg.conversation_id,
                 role=msg.role,
@@ -12,6 +12,10 @@ from src.services.pocketbase import pocketbase, PocketbaseError
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/inbox", tags=["inbox"])
 
+# Parameterized filters, values are bound by pocketbase.list_records
+_USER_FILTER = "user_id={:user}"
+_USER_STATUS_FILTER = "user_id={:user} && status={:status}"
+
 
 class InboxItem(BaseModel):
     """Inbox item response."""
@@ -52,19 +56,17 @@ async def list_inbox(
     Optionally filter by status (new, processed, archived).
     """
     try:
-        filter_parts = [f'user_id="{user_id}"']
-        if status:
-            filter_parts.append(f'status="{status}"')
-
         result = await pocketbase.list_records(
             "inbox_items",
-            filter=" && ".join(filter_parts),
+            filter=_USER_STATUS_FILTER if status else _USER_FILTER,
+            filter_params={"user": user_id, "status": status},
             sort="-created",
             per_page=limit,
         )
 
+        # Records come from Pocketbase already typed - skip validation
         items = [
-            InboxItem(
+            InboxItem.model_construct(
                 id=item["id"],
                 user_id=item["user_id"],
                 content=item["content"],
@@ -76,7 +78,7 @@ async def list_inbox(
             for item in result.get("items", [])
         ]
 
-        return InboxListResponse(
+        return InboxListResponse.model_construct(
             items=items,
             total=result.get("totalItems", len(items)),
         )
@@ -0,0 +1,39 @@
+"""
+Direct JSON responses for hot GET/POST endpoints.
+
+Routes return these Responses directly, so FastAPI skips response_model
+re-validation and jsonable_encoder. The body is encoded once with orjson
+and the same bytes are hashed for the ETag of polled endpoints.
+"""
+import hashlib
+from typing import Optional
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """Serialize a response model to JSON bytes with orjson."""
+    return orjson.dumps(model.model_dump())
+
+
+def json_response(body: bytes, etag: Optional[str] = None) -> Response:
+    """Wrap pre-encoded JSON bytes in a Response, optionally with an ETag."""
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def compute_etag(body: bytes) -> str:
+    """Compute a strong ETag from the encoded response body."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client already has this version."""
+    return request.headers.get("if-none-match") == etag
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
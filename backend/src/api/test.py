@@ -47,10 +47,9 @@ async def test_memory() -> MemoryTestResult:
 
     1. Creates MemoryService for test-user
     2. Adds test messages about workouts
-    3. Waits for indexing
-    4. Searches for "workouts" (should find)
-    5. Searches for "shopping" (should not find)
-    6. Gets all memories
+    3. Polls search for "workouts" until indexed (should find)
+    4. Searches for "shopping" (should not find)
+    5. Gets all memories
     """
     try:
         # Create service
@@ -69,17 +68,19 @@ async def test_memory() -> MemoryTestResult:
         ]
         add_result = await service.add(messages)
 
-        # Wait for indexing (Mem0 processes async)
-        await asyncio.sleep(2)
-
-        # Search for related content
-        search_result = await service.search("workouts", limit=5)
-
-        # Search for unrelated content
-        search_unrelated = await service.search("shopping groceries", limit=5)
-
-        # Get all memories
-        all_memories = await service.get_all(limit=10)
+        # Wait for indexing (Mem0 processes async): poll related search, up to 2s
+        search_result = []
+        for _ in range(20):
+            await asyncio.sleep(0.1)
+            search_result = await service.search("workouts", limit=5)
+            if search_result:
+                break
+
+        # Search unrelated content and get all memories concurrently
+        search_unrelated, all_memories = await asyncio.gather(
+            service.search("shopping groceries", limit=5),
+            service.get_all(limit=10),
+        )
 
         return MemoryTestResult(
             success=True,
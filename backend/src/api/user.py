@@ -4,10 +4,17 @@ User API endpoints.
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 from pydantic import BaseModel
 
-from src.services.memory import MemoryService
+from src.api.responses import (
+    compute_etag,
+    encode_model,
+    is_not_modified,
+    json_response,
+    not_modified,
+)
+from src.services.memory import get_memory_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/user", tags=["user"])
@@ -23,23 +30,32 @@ class UserProfile(BaseModel):
 
 @router.get("/profile", response_model=UserProfile)
 async def get_user_profile(
+    request: Request,
     user_id: str = Query(..., description="User identifier"),
-) -> UserProfile:
+) -> Response:
     """
     Get user profile with memories.
 
     Returns user data and extracted memories from Mem0.
+    Supports If-None-Match: returns 304 when the profile is unchanged.
     """
     memories = []
     try:
-        memory_service = MemoryService(user_id=user_id)
+        memory_service = get_memory_service(user_id)
         if memory_service.is_available:
             memories = await memory_service.get_all(limit=50)
     except Exception as e:
         logger.warning("Failed to load memories for profile: %s", e)
 
-    return UserProfile(
+    profile = UserProfile.model_construct(
         user_id=user_id,
         memories=memories,
         memories_count=len(memories),
     )
+
+    body = encode_model(profile)
+    etag = compute_etag(body)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    return json_response(body, etag)
@@ -1,10 +1,11 @@
 """
 WebSocket endpoint for real-time chat communication.
 """
-import json
 import logging
 import uuid
+from typing import Awaitable, Callable
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from src.services.connection_manager import manager
@@ -15,6 +16,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Static error frames, encoded once at import instead of per send
+INVALID_JSON_FRAME = orjson.dumps({
+    "type": "error",
+    "message": "Invalid JSON format",
+}).decode()
+EMPTY_CONTENT_FRAME = orjson.dumps({
+    "type": "error",
+    "message": "Message content cannot be empty",
+}).decode()
+WIDGET_ID_REQUIRED_FRAME = orjson.dumps({
+    "type": "error",
+    "message": "widget_id is required",
+}).decode()
+
 
 async def send_message_new(websocket: WebSocket, content: str, role: str, agent_name: str = None, message_id: str = None):
     """Send message.new event to client."""
@@ -59,6 +74,91 @@ async def send_agent_changed(websocket: WebSocket, agent_name: str):
     })
 
 
+async def _handle_message(websocket: WebSocket, data: dict) -> None:
+    """Handle message.send (and legacy message) frames."""
+    content = data.get("content", "")
+    user_id = data.get("user_id")
+    if user_id is None:
+        user_id = str(uuid.uuid4())
+    conversation_id = data.get("conversation_id")
+    request_id = data.get("request_id")  # For streaming support
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Processing message: user=%s, request_id=%s, content_len=%d",
+            user_id, request_id, len(content)
+        )
+
+    if not content.strip():
+        await manager.send_raw(websocket, EMPTY_CONTENT_FRAME)
+        return
+
+    # Process with Temporal workflow
+    # If request_id is provided, streaming will be used
+    # Otherwise, legacy notify_user activity delivers the response
+    result = await conversation_service.process_message(
+        user_id=user_id,
+        message=content,
+        websocket=websocket,
+        conversation_id=conversation_id,
+        request_id=request_id,
+    )
+
+    # Only send error if processing failed
+    # Success responses come via Temporal workflow -> notify activity
+    if not result.success:
+        await manager.send_personal(websocket, {
+            "type": "error",
+            "message": result.error or "Unknown error occurred",
+        })
+
+
+async def _handle_widget_complete(websocket: WebSocket, data: dict) -> None:
+    """Handle widget.complete frames."""
+    widget_id = data.get("widget_id")
+    widget_data = data.get("data", {})
+
+    if not widget_id:
+        await manager.send_raw(websocket, WIDGET_ID_REQUIRED_FRAME)
+        return
+
+    success = await widget_service.complete_widget(widget_id, widget_data)
+
+    await manager.send_personal(websocket, {
+        "type": "widget.completed" if success else "error",
+        "widget_id": widget_id,
+        "success": success,
+        "message": None if success else "Failed to complete widget",
+    })
+
+
+async def _handle_widget_cancel(websocket: WebSocket, data: dict) -> None:
+    """Handle widget.cancel frames."""
+    widget_id = data.get("widget_id")
+
+    if not widget_id:
+        await manager.send_raw(websocket, WIDGET_ID_REQUIRED_FRAME)
+        return
+
+    success = await widget_service.cancel_widget(widget_id)
+
+    await manager.send_personal(websocket, {
+        "type": "widget.cancelled" if success else "error",
+        "widget_id": widget_id,
+        "success": success,
+        "message": None if success else "Failed to cancel widget",
+    })
+
+
+# Incoming frame type -> handler; message is the legacy alias of message.send
+HANDLERS: dict[str, Callable[[WebSocket, dict], Awaitable[None]]] = {
+    "message.send": _handle_message,
+    "message": _handle_message,
+    "widget.complete": _handle_widget_complete,
+    "widget.cancel": _handle_widget_cancel,
+}
+
+
 @router.websocket("/chat")
 async def websocket_chat(websocket: WebSocket):
     """
@@ -92,105 +192,25 @@ async def websocket_chat(websocket: WebSocket):
 
             # Try to parse JSON
             try:
-                data = json.loads(raw_data)
-            except json.JSONDecodeError:
-                await manager.send_personal(websocket, {
-                    "type": "error",
-                    "message": "Invalid JSON format"
-                })
+                data = orjson.loads(raw_data)
+            except orjson.JSONDecodeError:
+                await manager.send_raw(websocket, INVALID_JSON_FRAME)
                 continue
 
             # Validate message structure
             msg_type = data.get("type")
 
-            # Debug: log incoming message
-            logger.info("Received message: type=%s, keys=%s", msg_type, list(data.keys()))
-
-            # Handle message.send (new) and message (legacy)
-            if msg_type in ("message.send", "message"):
-                content = data.get("content", "")
-                user_id = data.get("user_id", str(uuid.uuid4()))
-                conversation_id = data.get("conversation_id")
-                request_id = data.get("request_id")  # For streaming support
-
-                # Debug: log message details
-                logger.info(
-                    "Processing message: user=%s, request_id=%s, content_len=%d",
-                    user_id, request_id, len(content)
-                )
-
-                if not content.strip():
-                    await manager.send_personal(websocket, {
-                        "type": "error",
-                        "message": "Message content cannot be empty"
-                    })
-                    continue
-
-                # Process with Temporal workflow
-                # If request_id is provided, streaming will be used
-                # Otherwise, legacy notify_user activity delivers the response
-                result = await conversation_service.process_message(
-                    user_id=user_id,
-                    message=content,
-                    websocket=websocket,
-                    conversation_id=conversation_id,
-                    request_id=request_id,
-                )
-
-                # Only send error if processing failed
-                # Success responses come via Temporal workflow -> notify activity
-                if not result.success:
-                    await manager.send_personal(websocket, {
-                        "type": "error",
-                        "message": result.error or "Unknown error occurred",
-                    })
-
-            # Handle widget.complete
-            elif msg_type == "widget.complete":
-                widget_id = data.get("widget_id")
-                widget_data = data.get("data", {})
-
-                if not widget_id:
-                    await manager.send_personal(websocket, {
-                        "type": "error",
-                        "message": "widget_id is required"
-                    })
-                    continue
-
-                success = await widget_service.complete_widget(widget_id, widget_data)
-
-                await manager.send_personal(websocket, {
-                    "type": "widget.completed" if success else "error",
-                    "widget_id": widget_id,
-                    "success": success,
-                    "message": None if success else "Failed to complete widget",
-                })
-
-            # Handle widget.cancel
-            elif msg_type == "widget.cancel":
-                widget_id = data.get("widget_id")
-
-                if not widget_id:
-                    await manager.send_personal(websocket, {
-                        "type": "error",
-                        "message": "widget_id is required"
-                    })
-                    continue
-
-                success = await widget_service.cancel_widget(widget_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received message: type=%s, keys=%s", msg_type, list(data.keys()))
 
-                await manager.send_personal(websocket, {
-                    "type": "widget.cancelled" if success else "error",
-                    "widget_id": widget_id,
-                    "success": success,
-                    "message": None if success else "Failed to cancel widget",
-                })
-
-            else:
+            handler = HANDLERS.get(msg_type)
+            if handler is None:
                 await manager.send_personal(websocket, {
                     "type": "error",
                     "message": f"Unknown message type: {msg_type}"
                 })
+            else:
+                await handler(websocket, data)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
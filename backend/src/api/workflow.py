@@ -3,19 +3,74 @@ Workflow API endpoints.
 
 Uses Temporal queries to get workflow state.
 """
+import asyncio
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Callable, Optional
 
-from fastapi import APIRouter, Query, HTTPException
+import orjson
+from fastapi import APIRouter, Query, HTTPException, Request, Response
 from pydantic import BaseModel
+from temporalio.exceptions import WorkflowAlreadyStartedError
 from temporalio.service import RPCError
 
+from src.api.responses import (
+    compute_etag,
+    encode_model,
+    is_not_modified,
+    json_response,
+    not_modified,
+)
 from src.temporal.client import get_temporal_client
 from src.temporal.workflows.onboarding import OnboardingWorkflow, ONBOARDING_STEPS
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/workflow", tags=["workflow"])
 
+# Polling clients hit the same workflow queries within milliseconds:
+# share in-flight queries and reuse results for a short TTL.
+_QUERY_TTL_SECONDS = 0.05
+_QUERY_CACHE_MAX = 1024
+_inflight_queries: dict[tuple[str, str], asyncio.Task] = {}
+_query_results: dict[tuple[str, str], tuple[float, Any]] = {}
+
+
+def _on_query_done(key: tuple[str, str], task: asyncio.Task) -> None:
+    """Drop the in-flight entry and remember a successful result."""
+    _inflight_queries.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+
+    now = time.monotonic()
+    if len(_query_results) >= _QUERY_CACHE_MAX:
+        for stale in [k for k, (ts, _) in _query_results.items() if now - ts >= _QUERY_TTL_SECONDS]:
+            del _query_results[stale]
+    _query_results[key] = (now, task.result())
+
+
+async def _query_workflow(workflow_id: str, query: Callable) -> Any:
+    """
+    Query a workflow, coalescing concurrent identical queries.
+
+    Callers for the same workflow and query share one Temporal RPC;
+    results are reused for _QUERY_TTL_SECONDS.
+    """
+    key = (workflow_id, query.__name__)
+
+    cached = _query_results.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _QUERY_TTL_SECONDS:
+        return cached[1]
+
+    task = _inflight_queries.get(key)
+    if task is None:
+        client = await get_temporal_client()
+        task = asyncio.create_task(client.get_workflow_handle(workflow_id).query(query))
+        _inflight_queries[key] = task
+        task.add_done_callback(lambda t: _on_query_done(key, t))
+
+    # Shield so one cancelled request does not cancel the shared query
+    return await asyncio.shield(task)
+
 
 class WorkflowInstanceResponse(BaseModel):
     """Workflow instance response."""
@@ -86,32 +141,64 @@ class WorkflowProgressResponse(BaseModel):
     max_messages: int = 20
 
 
+# ONBOARDING_STEPS is static: build step responses and totals once
+_STEP_RESPONSES: dict[str, WorkflowStepResponse] = {
+    name: WorkflowStepResponse(
+        name=name,
+        agent=cfg.get("agent"),
+        is_required=cfg.get("is_required", True),
+        next_step=cfg.get("next"),
+    )
+    for name, cfg in ONBOARDING_STEPS.items()
+    if cfg
+}
+_TOTAL_STEPS = len(ONBOARDING_STEPS)
+_WORKFLOW_LIST_BODY = orjson.dumps({
+    "workflows": [
+        {
+            "name": "onboarding",
+            "steps": list(ONBOARDING_STEPS),
+        }
+    ]
+})
+
+
 @router.get("/current", response_model=CurrentWorkflowResponse)
 async def get_current_workflow(
+    request: Request,
     user_id: str = Query(..., description="User identifier"),
-) -> CurrentWorkflowResponse:
+) -> Response:
     """
     Get current active workflow for user.
 
     Returns the active workflow instance and current step info from Temporal.
+    Supports If-None-Match (304 when unchanged).
     """
+    current = await _get_current_workflow(user_id)
+
+    body = encode_model(current)
+    etag = compute_etag(body)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    return json_response(body, etag)
+
+
+async def _get_current_workflow(user_id: str) -> CurrentWorkflowResponse:
+    """Build current workflow response from Temporal state."""
     try:
-        client = await get_temporal_client()
         workflow_id = f"onboarding-{user_id}"
 
         # Try to get workflow state from Temporal
-        handle = client.get_workflow_handle(workflow_id)
-        state = await handle.query(OnboardingWorkflow.get_state)
+        state = await _query_workflow(workflow_id, OnboardingWorkflow.get_state)
 
         if not state:
-            return CurrentWorkflowResponse(instance=None, current_step=None)
+            return CurrentWorkflowResponse.model_construct(instance=None, current_step=None)
 
         # Build instance response
         current_step = state.get("current_step", "")
-        step_config = ONBOARDING_STEPS.get(current_step, {})
 
-        return CurrentWorkflowResponse(
-            instance=WorkflowInstanceResponse(
+        return CurrentWorkflowResponse.model_construct(
+            instance=WorkflowInstanceResponse.model_construct(
                 id=state.get("instance_id", ""),
                 user_id=state.get("user_id", user_id),
                 workflow_name=state.get("workflow_name", "onboarding"),
@@ -119,27 +206,22 @@ async def get_current_workflow(
                 status=state.get("status", "active"),
                 context=state.get("context", {}),
             ),
-            current_step=WorkflowStepResponse(
-                name=current_step,
-                agent=step_config.get("agent"),
-                is_required=step_config.get("is_required", True),
-                next_step=step_config.get("next"),
-            ) if step_config else None,
+            current_step=_STEP_RESPONSES.get(current_step),
         )
 
     except RPCError:
         # Workflow doesn't exist
-        return CurrentWorkflowResponse(instance=None, current_step=None)
+        return CurrentWorkflowResponse.model_construct(instance=None, current_step=None)
     except Exception as e:
         logger.error("Error getting workflow state: %s", e)
-        return CurrentWorkflowResponse(instance=None, current_step=None)
+        return CurrentWorkflowResponse.model_construct(instance=None, current_step=None)
 
 
 @router.post("/start", response_model=WorkflowInstanceResponse)
 async def start_workflow(
     user_id: str = Query(..., description="User identifier"),
     request: StartWorkflowRequest = ...,
-) -> WorkflowInstanceResponse:
+) -> Response:
     """Start a new workflow for user via Temporal."""
     from src.temporal.worker import TASK_QUEUE
 
@@ -154,31 +236,25 @@ async def start_workflow(
         client = await get_temporal_client()
         workflow_id = f"onboarding-{user_id}"
 
-        # Check if user already has active workflow
+        # Start new workflow; Temporal rejects the ID while one is running,
+        # so no separate existence probe is needed
         try:
-            handle = client.get_workflow_handle(workflow_id)
-            state = await handle.query(OnboardingWorkflow.get_state)
-            if state and state.get("status") == "active":
-                raise HTTPException(
-                    status_code=400,
-                    detail="User already has an active workflow",
-                )
-        except RPCError:
-            # Workflow doesn't exist, continue to create
-            pass
-
-        # Start new workflow
-        handle = await client.start_workflow(
-            OnboardingWorkflow.run,
-            args=[user_id, request.initial_context or {}],
-            id=workflow_id,
-            task_queue=TASK_QUEUE,
-        )
+            handle = await client.start_workflow(
+                OnboardingWorkflow.run,
+                args=[user_id, request.initial_context or {}],
+                id=workflow_id,
+                task_queue=TASK_QUEUE,
+            )
+        except WorkflowAlreadyStartedError:
+            raise HTTPException(
+                status_code=400,
+                detail="User already has an active workflow",
+            )
 
         # Query initial state
         state = await handle.query(OnboardingWorkflow.get_state)
 
-        return WorkflowInstanceResponse(
+        instance = WorkflowInstanceResponse.model_construct(
             id=state.get("instance_id", workflow_id),
             user_id=user_id,
             workflow_name="onboarding",
@@ -186,6 +262,7 @@ async def start_workflow(
             status="active",
             context=state.get("context", {}),
         )
+        return json_response(encode_model(instance))
 
     except HTTPException:
         raise
@@ -198,40 +275,35 @@ async def start_workflow(
 
 
 @router.get("/list")
-async def list_workflows() -> dict:
+async def list_workflows() -> Response:
     """List available workflow types."""
-    # Currently only onboarding is supported
-    return {
-        "workflows": [
-            {
-                "name": "onboarding",
-                "steps": list(ONBOARDING_STEPS.keys()),
-            }
-        ]
-    }
+    # Currently only onboarding is supported; payload is static
+    return json_response(_WORKFLOW_LIST_BODY)
 
 
 @router.get("/{user_id}/progress", response_model=WorkflowProgressResponse)
-async def get_workflow_progress(user_id: str) -> WorkflowProgressResponse:
+async def get_workflow_progress(
+    user_id: str,
+    request: Request,
+) -> Response:
     """
     Get workflow progress information from Temporal.
 
     Returns current step, completed steps, progress percentage,
     and message counts for the current step.
+    Supports If-None-Match (304 when unchanged).
     """
     try:
-        client = await get_temporal_client()
         workflow_id = f"onboarding-{user_id}"
 
-        handle = client.get_workflow_handle(workflow_id)
-        progress = await handle.query(OnboardingWorkflow.get_progress)
+        progress = await _query_workflow(workflow_id, OnboardingWorkflow.get_progress)
 
-        return WorkflowProgressResponse(
+        result = WorkflowProgressResponse.model_construct(
             workflow_id="onboarding",
             instance_id=workflow_id,
             current_step=progress.get("current_step", ""),
             current_step_index=progress.get("completed", 0),
-            total_steps=progress.get("total", len(ONBOARDING_STEPS)),
+            total_steps=progress.get("total", _TOTAL_STEPS),
             progress_percent=progress.get("percentage", 0),
             steps_completed=progress.get("steps_completed", []),
             status="active" if progress.get("percentage", 0) < 100 else "completed",
@@ -245,3 +317,9 @@ async def get_workflow_progress(user_id: str) -> WorkflowProgressResponse:
     except Exception as e:
         logger.error("Error getting workflow progress: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+
+    body = encode_model(result)
+    etag = compute_etag(body)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    return json_response(body, etag)
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic import field_validator
@@ -32,20 +32,24 @@ class StreamingConfig:
     # Buffer settings for chunk aggregation
     chunk_buffer_size: int = 10
 
-    @property
-    def disconnect_delay_ms(self) -> int:
-        """Delay in milliseconds for frontend compatibility."""
-        return int(self.disconnect_delay.total_seconds() * 1000)
-
-    @property
-    def stream_start_timeout_seconds(self) -> float:
-        """Timeout in seconds for Temporal activities."""
-        return self.stream_start_timeout.total_seconds()
-
-    @property
-    def stream_completion_timeout_seconds(self) -> float:
-        """Timeout in seconds for stream completion."""
-        return self.stream_completion_timeout.total_seconds()
+    # Derived values, computed once in __post_init__
+    disconnect_delay_ms: int = field(init=False)  # for frontend compatibility
+    stream_start_timeout_seconds: float = field(init=False)  # for Temporal activities
+    stream_completion_timeout_seconds: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: set derived fields via object.__setattr__
+        object.__setattr__(
+            self, "disconnect_delay_ms", int(self.disconnect_delay.total_seconds() * 1000)
+        )
+        object.__setattr__(
+            self, "stream_start_timeout_seconds", self.stream_start_timeout.total_seconds()
+        )
+        object.__setattr__(
+            self,
+            "stream_completion_timeout_seconds",
+            self.stream_completion_timeout.total_seconds(),
+        )
 
 
 # Singleton streaming config
@@ -72,6 +76,7 @@ class Settings(BaseSettings):
     mem0_llm_model: str = "gpt-5-mini"
     mem0_embedder_provider: str = "openai"
     mem0_embedder_model: str = "text-embedding-3-small"
+    mem0_max_concurrency: int = 32  # concurrent Mem0 calls per process
 
     # Default AI Agent LLM settings (can be overridden per agent)
     llm_provider: str = "openai"  # openai, anthropic, ollama
@@ -103,6 +108,11 @@ class Settings(BaseSettings):
 
         Returns model in format: "provider:model" or just "model" for openai
         """
+        return self.llm_model_id
+
+    @cached_property
+    def llm_model_id(self) -> str:
+        """Model string for pydantic-ai, computed once (settings are read-only)."""
         if self.llm_provider == "openai":
             return f"openai:{self.llm_model}"
         elif self.llm_provider == "anthropic":
@@ -6,10 +6,9 @@ Loads YAML configuration files at startup.
 import logging
 from pathlib import Path
 
-import yaml
-
-from src.services.agent import agent_service, AgentConfig
+from src.services.agent import agent_service
 from src.services.workflow import WorkflowService
+from src.yaml_loader import list_yaml_files, load_yaml, parse_files
 
 logger = logging.getLogger(__name__)
 
@@ -20,53 +19,7 @@ WORKFLOWS_DIR = Path(__file__).parent.parent / "workflows"
 
 def load_agent_configs(directory: Path = AGENTS_DIR) -> int:
     """Load all agent configurations from directory."""
-    if not directory.exists():
-        logger.warning("Agents directory not found: %s", directory)
-        return 0
-
-    count = 0
-    for path in directory.glob("*.yaml"):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            config = AgentConfig(
-                name=data["name"],
-                description=data.get("description", ""),
-                system_prompt=data.get("system_prompt", ""),
-                model=data.get("model"),
-                tools=data.get("tools", []),
-                response_format=data.get("response_format"),
-            )
-            agent_service.register_config(config)
-            count += 1
-            logger.debug("Loaded agent config: %s", config.name)
-
-        except Exception as e:
-            logger.error("Failed to load agent config %s: %s", path.name, e)
-
-    for path in directory.glob("*.yml"):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            config = AgentConfig(
-                name=data["name"],
-                description=data.get("description", ""),
-                system_prompt=data.get("system_prompt", ""),
-                model=data.get("model"),
-                tools=data.get("tools", []),
-                response_format=data.get("response_format"),
-            )
-            agent_service.register_config(config)
-            count += 1
-            logger.debug("Loaded agent config: %s", config.name)
-
-        except Exception as e:
-            logger.error("Failed to load agent config %s: %s", path.name, e)
-
-    logger.info("Loaded %d agent configurations", count)
-    return count
+    return agent_service.load_configs_from_directory(directory)
 
 
 def load_workflow_configs(directory: Path = WORKFLOWS_DIR) -> int:
@@ -76,10 +29,10 @@ def load_workflow_configs(directory: Path = WORKFLOWS_DIR) -> int:
         return 0
 
     count = 0
-    for path in list(directory.glob("*.yaml")) + list(directory.glob("*.yml")):
+    for path, data in parse_files(list_yaml_files(directory), load_yaml):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            if isinstance(data, Exception):
+                raise data
 
             WorkflowService.register_workflow(data["name"], data)
             count += 1
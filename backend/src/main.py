@@ -17,23 +17,19 @@ from src.services.pocketbase import pocketbase, PocketbaseError
 from src.services.memory import check_memory_service
 from src.services.db_init import init_database
 from src.config_loader import load_all_configs
+from src.temporal.client import get_temporal_client
 from src.temporal.worker import run_worker
 
 # Configure logging
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
+    level=logging.getLevelNamesMapping().get(settings.log_level.upper(), logging.INFO),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Startup and shutdown events."""
-    # Startup
-    logger.info("Backend starting...")
-
-    # Check Pocketbase connection
+async def _init_pocketbase() -> None:
+    """Check Pocketbase connection and initialize database collections."""
     try:
         health = await pocketbase.health_check()
         logger.info("Pocketbase connected: %s", health.get("message", "OK"))
@@ -44,17 +40,37 @@ async def lifespan(app: FastAPI):
     except PocketbaseError as e:
         logger.error("Pocketbase connection failed: %s", e.message)
 
-    # Load agent and workflow configurations
-    agents_count, workflows_count = load_all_configs()
-    logger.info("Loaded %d agents and %d workflows", agents_count, workflows_count)
 
-    # Check Mem0/Memory service
+async def _check_mem0() -> None:
+    """Check Mem0/Memory service (also builds the shared Mem0 client)."""
     mem0_ok, mem0_msg = await check_memory_service()
     if mem0_ok:
         logger.info("Mem0: %s", mem0_msg)
     else:
         logger.warning("Mem0: %s (memory features will be disabled)", mem0_msg)
 
+
+async def _warm_temporal() -> None:
+    """Warm Temporal client so the first API request doesn't pay for connect."""
+    try:
+        await get_temporal_client()
+    except Exception as e:
+        logger.warning("Temporal client warm-up failed: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup and shutdown events."""
+    # Startup
+    logger.info("Backend starting...")
+
+    # Load agent and workflow configurations
+    agents_count, workflows_count = load_all_configs()
+    logger.info("Loaded %d agents and %d workflows", agents_count, workflows_count)
+
+    # External services are independent: check them concurrently
+    await asyncio.gather(_init_pocketbase(), _check_mem0(), _warm_temporal())
+
     # Start Temporal worker in background
     worker_task = None
     try:
@@ -82,7 +98,10 @@ async def lifespan(app: FastAPI):
             logger.info("Temporal worker stopped")
 
 
-app = FastAPI(title="AI Life OS Backend", lifespan=lifespan)
+app = FastAPI(
+    title="AI Life OS Backend",
+    lifespan=lifespan,
+)
 
 # CORS middleware
 app.add_middleware(
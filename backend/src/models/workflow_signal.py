@@ -55,12 +55,14 @@ class AgentOutput(BaseModel):
         description="Optional signal to the workflow engine",
     )
 
+    # Factories build from trusted arguments: skip validation (model_construct)
+
     @classmethod
     def stay(cls, content: str, data: Optional[dict] = None) -> "AgentOutput":
         """Create a response that stays on current step."""
-        return cls(
+        return cls.model_construct(
             content=content,
-            workflow_signal=WorkflowSignal(
+            workflow_signal=WorkflowSignal.model_construct(
                 action=WorkflowAction.STAY,
                 data=data or {},
             ),
@@ -74,9 +76,9 @@ class AgentOutput(BaseModel):
         reason: Optional[str] = None,
     ) -> "AgentOutput":
         """Create a response that completes the current step."""
-        return cls(
+        return cls.model_construct(
             content=content,
-            workflow_signal=WorkflowSignal(
+            workflow_signal=WorkflowSignal.model_construct(
                 action=WorkflowAction.COMPLETE_STEP,
                 data=data or {},
                 reason=reason,
@@ -90,9 +92,9 @@ class AgentOutput(BaseModel):
         data: Optional[dict] = None,
     ) -> "AgentOutput":
         """Create a response that requests specific input."""
-        return cls(
+        return cls.model_construct(
             content=content,
-            workflow_signal=WorkflowSignal(
+            workflow_signal=WorkflowSignal.model_construct(
                 action=WorkflowAction.NEED_INPUT,
                 data=data or {},
             ),
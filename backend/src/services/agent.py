@@ -5,21 +5,23 @@ Provides a registry for loading and accessing PydanticAI agents
 configured via YAML files.
 """
 import logging
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Optional
 
-import yaml
 from pydantic_ai import Agent
 
 from src.config import settings
 from src.ai.context import AgentDeps
 from src.models.workflow_signal import WorkflowSignal, AgentOutput, WorkflowAction
+from src.yaml_loader import list_yaml_files, load_yaml, parse_files
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for an AI agent."""
 
@@ -31,7 +33,44 @@ class AgentConfig:
     response_format: Optional[dict] = None
 
 
-@dataclass
+def _parse_agent_config(path: Path) -> AgentConfig:
+    """Parse an agent YAML file into AgentConfig."""
+    data = load_yaml(path)
+
+    return AgentConfig(
+        name=data["name"],
+        description=data.get("description", ""),
+        system_prompt=data.get("system_prompt", ""),
+        model=data.get("model"),
+        tools=data.get("tools", []),
+        response_format=data.get("response_format"),
+    )
+
+
+@lru_cache(maxsize=128)
+def _resolve_model_cached(
+    model_config: Optional[str],
+    default_model: str,
+    default_provider: str,
+    fallback_model: str,
+) -> str:
+    """Resolve model string; cached since configs and settings are fixed."""
+    if not model_config:
+        return default_model
+
+    # Check for environment variable reference
+    if model_config.startswith("${") and model_config.endswith("}"):
+        env_var = model_config[2:-1]
+        model_config = os.getenv(env_var, fallback_model)
+
+    # If no provider prefix, add default provider
+    if ":" not in model_config:
+        return f"{default_provider}:{model_config}"
+
+    return model_config
+
+
+@dataclass(slots=True)
 class AgentResponse:
     """Standardized agent response."""
 
@@ -69,17 +108,7 @@ class AgentService:
     def load_config(self, config_path: Path) -> Optional[AgentConfig]:
         """Load agent configuration from YAML file."""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            config = AgentConfig(
-                name=data["name"],
-                description=data.get("description", ""),
-                system_prompt=data.get("system_prompt", ""),
-                model=data.get("model"),
-                tools=data.get("tools", []),
-                response_format=data.get("response_format"),
-            )
+            config = _parse_agent_config(config_path)
 
             self._configs[config.name] = config
             logger.info("Loaded agent config: %s", config.name)
@@ -95,14 +124,15 @@ class AgentService:
             logger.warning("Agent config directory not found: %s", directory)
             return 0
 
+        # Parse in worker threads; registry writes stay on this thread
         count = 0
-        for path in directory.glob("*.yaml"):
-            if self.load_config(path):
-                count += 1
-
-        for path in directory.glob("*.yml"):
-            if self.load_config(path):
-                count += 1
+        for path, result in parse_files(list_yaml_files(directory), _parse_agent_config):
+            if isinstance(result, Exception):
+                logger.error("Failed to load agent config from %s: %s", path, result)
+                continue
+            # register_config also drops a cached agent built from an older config
+            self.register_config(result)
+            count += 1
 
         logger.info("Loaded %d agent configs from %s", count, directory)
         return count
@@ -133,21 +163,26 @@ class AgentService:
         - "gpt-5-mini" -> add default provider
         - "${LLM_MODEL}" -> resolve from environment
         """
-        import os
-
-        if not model_config:
-            return settings.get_llm_model()
-
-        # Check for environment variable reference
-        if model_config.startswith("${") and model_config.endswith("}"):
-            env_var = model_config[2:-1]
-            model_config = os.getenv(env_var, settings.llm_model)
-
-        # If no provider prefix, add default provider
-        if ":" not in model_config:
-            return f"{settings.llm_provider}:{model_config}"
+        return _resolve_model_cached(
+            model_config,
+            settings.get_llm_model(),
+            settings.llm_provider,
+            settings.llm_model,
+        )
 
-        return model_config
+    def _resolve_tools(self, config: AgentConfig) -> list[Callable]:
+        """Look up registered tool functions listed in agent config."""
+        tools = []
+        for tool_name in config.tools:
+            if tool_name in self._tools:
+                tools.append(self._tools[tool_name])
+            else:
+                logger.warning(
+                    "Tool '%s' not found for agent '%s'",
+                    tool_name,
+                    config.name,
+                )
+        return tools
 
     def _create_agent(self, config: AgentConfig) -> Agent:
         """Create a PydanticAI agent from configuration."""
@@ -158,19 +193,9 @@ class AgentService:
             model=model,
             deps_type=AgentDeps,
             system_prompt=config.system_prompt,
+            tools=self._resolve_tools(config),
         )
 
-        # Register tools
-        for tool_name in config.tools:
-            if tool_name in self._tools:
-                agent.tool(self._tools[tool_name])
-            else:
-                logger.warning(
-                    "Tool '%s' not found for agent '%s'",
-                    tool_name,
-                    config.name,
-                )
-
         return agent
 
     def get_agent(self, name: str) -> Optional[Agent]:
@@ -219,7 +244,7 @@ class AgentService:
             result = await agent.run(message, deps=deps)
 
             # Extract response
-            response_text = result.output if hasattr(result, "output") else str(result)
+            response_text = result.output
 
             return AgentResponse(
                 content=response_text,
@@ -251,48 +276,39 @@ class AgentService:
             model,
         )
 
-        # Create agent with structured output
+        # Create agent with structured output.
+        # The static base prompt goes first so it forms a cacheable prefix;
+        # per-user memories follow, volatile workflow/collections come last.
         agent: Agent[AgentDeps, AgentOutput] = Agent(
             model=model,
             deps_type=AgentDeps,
             output_type=AgentOutput,
+            system_prompt=config.system_prompt,
+            tools=self._resolve_tools(config),
         )
 
-        # Add dynamic system prompt that includes workflow context
+        @agent.system_prompt
+        async def memory_system_prompt(ctx) -> str:
+            deps: AgentDeps = ctx.deps
+            return deps.get_memories_summary()
+
         @agent.system_prompt
         async def workflow_system_prompt(ctx) -> str:
             deps: AgentDeps = ctx.deps
-            base_prompt = config.system_prompt
 
             # Get workflow context instructions
             workflow_prompt = deps.get_workflow_prompt_context()
 
             # Get data context
             collections_summary = deps.get_collections_summary()
-            memories_summary = deps.get_memories_summary()
-
-            return f"""{base_prompt}
 
-{workflow_prompt}
+            return f"""{workflow_prompt}
 
 ## Available Data
 
 {collections_summary}
-
-{memories_summary}
 """
 
-        # Register tools
-        for tool_name in config.tools:
-            if tool_name in self._tools:
-                agent.tool(self._tools[tool_name])
-            else:
-                logger.warning(
-                    "Tool '%s' not found for workflow agent '%s'",
-                    tool_name,
-                    config.name,
-                )
-
         return agent
 
     async def run_workflow_agent(
@@ -352,6 +368,8 @@ class AgentService:
     def clear_cache(self) -> None:
         """Clear cached agents (useful for config reload)."""
         self._agents.clear()
+        # ${ENV} model references are re-read after a reload
+        _resolve_model_cached.cache_clear()
         logger.info("Cleared agent cache")
 
 
@@ -8,12 +8,17 @@ before transitioning to the next step.
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
+
+from src.services.memory import get_memory_service
+from src.services.pocketbase import pocketbase
 
 logger = logging.getLogger(__name__)
 
+_USER_FILTER = "user_id={:user}"
+
 
-@dataclass
+@dataclass(slots=True)
 class CriteriaResult:
     """Result of a criteria check."""
 
@@ -89,9 +94,7 @@ class AgentSignalWithMemoryChecker(CompletionCriteriaChecker):
         category = params.get("category")
 
         try:
-            from src.services.memory import MemoryService
-
-            memory_service = MemoryService(user_id=user_id)
+            memory_service = get_memory_service(user_id)
 
             if not memory_service.is_available:
                 # Graceful degradation - if Mem0 unavailable, pass the check
@@ -106,7 +109,8 @@ class AgentSignalWithMemoryChecker(CompletionCriteriaChecker):
 
             # Search for facts in the category
             query = category if category else "user preferences priorities goals"
-            facts = await memory_service.search(query, limit=min_facts + 5)
+            # Only the count matters: min_facts results are enough to decide
+            facts = await memory_service.search(query, limit=min_facts)
 
             if len(facts) >= min_facts:
                 return CriteriaResult(
@@ -160,11 +164,14 @@ class AgentSignalWithWidgetChecker(CompletionCriteriaChecker):
         collection = params.get("collection", "inbox_items")
 
         try:
-            from src.services.pocketbase import pocketbase
-
+            # Only the count matters: fetch at most min_items ids
             result = await pocketbase.list_records(
                 collection,
-                filter=f'user_id="{user_id}"',
+                filter=_USER_FILTER,
+                filter_params={"user": user_id},
+                per_page=min_items,
+                fields="id",
+                skip_total=True,
             )
             items = result.get("items", [])
 
@@ -222,9 +229,16 @@ _checkers: dict[str, CompletionCriteriaChecker] = {
 }
 
 
+# Bound check methods, prebuilt so dispatch is a single dict lookup
+_CHECK_FUNCS: dict[str, Callable[..., Awaitable[CriteriaResult]]] = {
+    name: checker.check for name, checker in _checkers.items()
+}
+
+
 def register_checker(name: str, checker: CompletionCriteriaChecker) -> None:
     """Register a custom completion criteria checker."""
     _checkers[name] = checker
+    _CHECK_FUNCS[name] = checker.check
     logger.info("Registered completion criteria checker: %s", name)
 
 
@@ -254,16 +268,16 @@ async def check_completion_criteria(
     criteria_type = criteria_config.get("type", "agent_signal")
     params = criteria_config.get("params", {})
 
-    checker = _checkers.get(criteria_type)
-    if not checker:
+    check = _CHECK_FUNCS.get(criteria_type)
+    if check is None:
         logger.warning(
             "Unknown criteria type '%s', defaulting to agent_signal",
             criteria_type,
         )
-        checker = _checkers["agent_signal"]
+        check = _CHECK_FUNCS["agent_signal"]
 
     try:
-        result = await checker.check(
+        result = await check(
             workflow_instance_id,
             user_id,
             signal_data,
@@ -1,11 +1,94 @@
+import asyncio
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
 
+def _encode(data: dict[str, Any]) -> str:
+    """Serialize event payload to JSON text with orjson."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Bound per-connection backlog so a slow client cannot grow memory unbounded
+SEND_QUEUE_MAX = 256
+# Max frames coalesced into one {"type": "batch"} frame
+BATCH_MAX = 16
+
+
+def _encode_batch(messages: list[str]) -> str:
+    """Wrap already-encoded event frames into a single batch frame."""
+    return '{"type":"batch","events":[' + ",".join(messages) + "]}"
+
+
+class _ConnectionWriter:
+    """
+    Send queue for one WebSocket, drained by a single writer task.
+
+    Frames queued while a send is in flight are coalesced into one batch
+    frame on the next write, so bursts (stream chunks, step/widget events)
+    cost one socket write. A lone frame is sent as-is without waiting.
+    """
+
+    __slots__ = ("_websocket", "_queue", "_on_error", "_task")
+
+    def __init__(self, websocket: WebSocket, on_error: Callable[[WebSocket], None]):
+        self._websocket = websocket
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=SEND_QUEUE_MAX)
+        self._on_error = on_error
+        self._task = asyncio.create_task(self._run())
+
+    def send(self, message: str) -> bool:
+        """
+        Queue an encoded frame.
+
+        A client too far behind to accept it is disconnected rather than
+        silently missing frames; it reconnects and resyncs state.
+
+        Returns:
+            True if queued, False if the client was disconnected
+        """
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Send queue full, disconnecting slow client")
+            self._on_error(self._websocket)
+            # Closing the socket ends its receive loop in the websocket route
+            self._task = asyncio.create_task(self._close_socket())
+            return False
+
+    def close(self) -> None:
+        """Stop the writer task; pending frames are dropped."""
+        self._task.cancel()
+
+    async def _close_socket(self) -> None:
+        try:
+            # 1013: Try Again Later
+            await self._websocket.close(code=1013)
+        except Exception as e:
+            logger.debug("Failed to close slow websocket: %s", e)
+
+    async def _run(self) -> None:
+        while True:
+            message = await self._queue.get()
+            if not self._queue.empty():
+                messages = [message]
+                while len(messages) < BATCH_MAX and not self._queue.empty():
+                    messages.append(self._queue.get_nowait())
+                message = _encode_batch(messages)
+
+            try:
+                await self._websocket.send_text(message)
+            except Exception as e:
+                logger.warning("Failed to send to websocket: %s", e)
+                self._on_error(self._websocket)
+                return
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections.
@@ -16,16 +99,19 @@ class ConnectionManager:
     """
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
-        # Map user_id -> list of WebSocket connections
-        self.user_connections: dict[str, list[WebSocket]] = {}
+        self.active_connections: set[WebSocket] = set()
+        # Map user_id -> set of WebSocket connections
+        self.user_connections: dict[str, set[WebSocket]] = {}
         # Reverse map: WebSocket -> user_id
         self._websocket_users: dict[WebSocket, str] = {}
+        # Per-connection send queues
+        self._writers: dict[WebSocket, _ConnectionWriter] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and store a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        self._writers[websocket] = _ConnectionWriter(websocket, self.disconnect)
         logger.info("Client connected. Total connections: %d", len(self.active_connections))
 
     def register_user(self, user_id: str, websocket: WebSocket) -> None:
@@ -40,26 +126,27 @@ class ConnectionManager:
             self._remove_user_connection(old_user_id, websocket)
 
         # Add to new user
-        if user_id not in self.user_connections:
-            self.user_connections[user_id] = []
-
-        if websocket not in self.user_connections[user_id]:
-            self.user_connections[user_id].append(websocket)
+        connections = self.user_connections.setdefault(user_id, set())
+        if websocket not in connections:
+            connections.add(websocket)
             self._websocket_users[websocket] = user_id
             logger.debug("Registered websocket for user: %s", user_id)
 
     def _remove_user_connection(self, user_id: str, websocket: WebSocket) -> None:
         """Remove a WebSocket from user's connections."""
-        if user_id in self.user_connections:
-            if websocket in self.user_connections[user_id]:
-                self.user_connections[user_id].remove(websocket)
-            if not self.user_connections[user_id]:
+        connections = self.user_connections.get(user_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
                 del self.user_connections[user_id]
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+
+        writer = self._writers.pop(websocket, None)
+        if writer is not None:
+            writer.close()
 
         # Clean up user association
         user_id = self._websocket_users.pop(websocket, None)
@@ -68,10 +155,24 @@ class ConnectionManager:
 
         logger.info("Client disconnected. Total connections: %d", len(self.active_connections))
 
+    def _send(self, websocket: WebSocket, message: str) -> bool:
+        """Queue an encoded frame on the connection's writer."""
+        writer = self._writers.get(websocket)
+        if writer is None:
+            return False
+        return writer.send(message)
+
     async def send_personal(self, websocket: WebSocket, data: dict[str, Any]) -> None:
-        """Send JSON data to a specific client."""
+        """Send JSON data to a specific client (serialized with orjson)."""
+        await self.send_raw(websocket, _encode(data))
+
+    async def send_raw(self, websocket: WebSocket, message: str) -> None:
+        """Send an already-serialized JSON text frame to a specific client."""
+        if self._send(websocket, message):
+            return
+        # Not managed by connect() (no writer): send directly
         try:
-            await websocket.send_json(data)
+            await websocket.send_text(message)
         except Exception as e:
             logger.warning("Failed to send to websocket: %s", e)
 
@@ -84,53 +185,37 @@ class ConnectionManager:
             data: JSON-serializable data
 
         Returns:
-            True if sent to at least one connection, False otherwise
+            True if queued on at least one connection, False otherwise
         """
-        connections = self.user_connections.get(user_id, [])
+        connections = self.user_connections.get(user_id)
 
         if not connections:
             logger.debug("No active connections for user: %s", user_id)
             return False
 
+        message = _encode(data)
         sent = False
-        disconnected = []
-
-        for websocket in connections:
-            try:
-                await websocket.send_json(data)
-                sent = True
-            except Exception as e:
-                logger.warning("Failed to send to user %s: %s", user_id, e)
-                disconnected.append(websocket)
-
-        # Clean up disconnected websockets
-        for ws in disconnected:
-            self.disconnect(ws)
+        # Copy: a full queue disconnects its socket, which edits the set
+        for websocket in tuple(connections):
+            sent = self._send(websocket, message) or sent
 
         return sent
 
     async def broadcast(self, data: dict[str, Any]) -> None:
         """Send JSON data to all connected clients."""
-        disconnected = []
-
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(data)
-            except Exception as e:
-                logger.warning("Failed to broadcast: %s", e)
-                disconnected.append(connection)
+        message = _encode(data)
 
-        # Clean up disconnected websockets
-        for ws in disconnected:
-            self.disconnect(ws)
+        for connection in tuple(self.active_connections):
+            self._send(connection, message)
 
     def get_user_connection_count(self, user_id: str) -> int:
         """Get number of active connections for a user."""
-        return len(self.user_connections.get(user_id, []))
+        return len(self.user_connections.get(user_id, ()))
 
     def is_user_connected(self, user_id: str) -> bool:
         """Check if user has any active connections."""
-        return user_id in self.user_connections and len(self.user_connections[user_id]) > 0
+        # Empty sets are removed in _remove_user_connection
+        return user_id in self.user_connections
 
 
 # Singleton instance
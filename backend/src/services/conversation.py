@@ -5,13 +5,18 @@ Orchestrates message handling via Temporal workflows.
 Messages are sent as signals to the workflow, and responses
 are delivered via WebSocket through notify activities.
 """
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 
+import orjson
 from fastapi import WebSocket
-from temporalio.client import WorkflowHandle
-from temporalio.service import RPCError
+from temporalio.client import Client, WorkflowHandle
+from temporalio.common import WorkflowIDConflictPolicy
+from temporalio.service import RPCError, RPCStatusCode
 
 from src.services.pocketbase import pocketbase, PocketbaseError
 from src.services.connection_manager import manager
@@ -24,8 +29,24 @@ logger = logging.getLogger(__name__)
 # Default workflow for new users
 DEFAULT_WORKFLOW = "onboarding"
 
+_ACTIVE_CONVERSATION_FILTER = 'user_id={:user} && status="active"'
+_CONVERSATION_MESSAGES_FILTER = "conversation_id={:conversation}"
+# Server-side projection for get_history (MessageData fields only)
+_HISTORY_FIELDS = "id,conversation_id,role,content,agent_name"
+_HISTORY_FIELDS_WITH_METADATA = _HISTORY_FIELDS + ",metadata"
 
-@dataclass
+# Active conversation per user, reused for a short TTL;
+# create_conversation/complete_conversation invalidate it.
+_ACTIVE_CONVERSATION_TTL_SECONDS = 60.0
+_ACTIVE_CONVERSATION_CACHE_MAX = 10_000
+# Workflow IDs remembered as running (LRU); an evicted one just takes the start call again
+_KNOWN_WORKFLOWS_MAX = 10_000
+
+# Sent on every user turn; encoded once at import
+THINKING_FRAME = orjson.dumps({"type": "thinking"}).decode()
+
+
+@dataclass(slots=True)
 class ConversationData:
     """Conversation data from database."""
 
@@ -36,7 +57,7 @@ class ConversationData:
     status: str = "active"
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageData:
     """Message data from database."""
 
@@ -48,7 +69,7 @@ class MessageData:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationResult:
     """Result of processing a message."""
 
@@ -72,6 +93,105 @@ class ConversationService:
     6. Handle WebSocket events
     """
 
+    def __init__(self):
+        self._active_conv_cache: dict[str, tuple[float, ConversationData]] = {}
+        # Concurrent lookups for one user share a single Pocketbase query
+        self._active_conv_inflight: dict[str, asyncio.Task] = {}
+        # Workflow IDs signalled successfully by this process; their
+        # per-message existence probe (a Temporal query) is skipped
+        self._known_workflows: OrderedDict[str, None] = OrderedDict()
+        # Messages waiting for the in-flight signal to their workflow
+        self._signal_batches: dict[str, list[tuple[UserMessage, asyncio.Future]]] = {}
+        # Strong references to fire-and-forget tasks
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def _on_active_lookup_done(self, user_id: str, task: asyncio.Task) -> None:
+        """Drop the in-flight entry and cache a found conversation."""
+        if self._active_conv_inflight.get(user_id) is not task:
+            # Invalidated while in flight - result may be stale
+            return
+        del self._active_conv_inflight[user_id]
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        conversation = task.result()
+        if conversation is None:
+            return
+
+        now = time.monotonic()
+        cache = self._active_conv_cache
+        if len(cache) >= _ACTIVE_CONVERSATION_CACHE_MAX:
+            for stale in [
+                k for k, (ts, _) in cache.items()
+                if now - ts >= _ACTIVE_CONVERSATION_TTL_SECONDS
+            ]:
+                del cache[stale]
+        cache[user_id] = (now, conversation)
+
+    def _invalidate_active_conversation(self, user_id: str) -> None:
+        """Forget the cached active conversation for a user."""
+        self._active_conv_cache.pop(user_id, None)
+        self._active_conv_inflight.pop(user_id, None)
+
+    def _remember_workflow(self, workflow_id: str) -> None:
+        """Mark a workflow as signalled, evicting the least recently used one."""
+        self._known_workflows[workflow_id] = None
+        self._known_workflows.move_to_end(workflow_id)
+        if len(self._known_workflows) > _KNOWN_WORKFLOWS_MAX:
+            self._known_workflows.popitem(last=False)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until done."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _signal_user_message(
+        self,
+        handle: WorkflowHandle,
+        message: UserMessage,
+    ) -> None:
+        """
+        Signal a user message, coalescing bursts per workflow.
+
+        The first message is signalled right away; messages arriving while
+        that signal is in flight go out together as one user_messages signal.
+        Raises the signal error for every message in a failed batch.
+        """
+        future = asyncio.get_running_loop().create_future()
+        batch = self._signal_batches.get(handle.id)
+        if batch is None:
+            self._signal_batches[handle.id] = [(message, future)]
+            self._spawn(self._flush_signals(handle))
+        else:
+            batch.append((message, future))
+        await future
+
+    async def _flush_signals(self, handle: WorkflowHandle) -> None:
+        """Send queued messages for one workflow until none are left."""
+        workflow_id = handle.id
+        try:
+            while batch := self._signal_batches.get(workflow_id):
+                # Messages arriving from now on wait for the next round
+                self._signal_batches[workflow_id] = []
+                messages = [message for message, _ in batch]
+                try:
+                    if len(messages) == 1:
+                        await handle.signal(OnboardingWorkflow.user_message, messages[0])
+                    else:
+                        await handle.signal(OnboardingWorkflow.user_messages, messages)
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+        finally:
+            self._signal_batches.pop(workflow_id, None)
+
     async def create_conversation(
         self,
         user_id: str,
@@ -89,6 +209,7 @@ class ConversationService:
                     "status": "active",
                 },
             )
+            self._invalidate_active_conversation(user_id)
             return ConversationData(
                 id=record["id"],
                 user_id=user_id,
@@ -100,16 +221,55 @@ class ConversationService:
             logger.error("Failed to create conversation: %s", e.message)
             return None
 
+    async def get_conversation(
+        self,
+        conversation_id: str,
+    ) -> Optional[ConversationData]:
+        """Get conversation by ID."""
+        try:
+            record = await pocketbase.get_record("conversations", conversation_id)
+            return ConversationData(
+                id=record["id"],
+                user_id=record["user_id"],
+                agent_name=record.get("agent_name"),
+                workflow_instance_id=record.get("workflow_instance_id"),
+                status=record["status"],
+            )
+        except PocketbaseError as e:
+            logger.error("Failed to get conversation: %s", e.message)
+            return None
+
     async def get_active_conversation(
         self,
         user_id: str,
     ) -> Optional[ConversationData]:
-        """Get active conversation for a user."""
+        """Get active conversation for a user (cached for a short TTL)."""
+        cached = self._active_conv_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < _ACTIVE_CONVERSATION_TTL_SECONDS:
+            return cached[1]
+
+        task = self._active_conv_inflight.get(user_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_active_conversation(user_id))
+            self._active_conv_inflight[user_id] = task
+            task.add_done_callback(lambda t: self._on_active_lookup_done(user_id, t))
+
+        # Shield so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(task)
+
+    async def _fetch_active_conversation(
+        self,
+        user_id: str,
+    ) -> Optional[ConversationData]:
+        """Query Pocketbase for the user's most recent active conversation."""
         try:
             result = await pocketbase.list_records(
                 "conversations",
-                filter=f'user_id="{user_id}" && status="active"',
+                filter=_ACTIVE_CONVERSATION_FILTER,
+                filter_params={"user": user_id},
                 sort="-created",
+                per_page=1,
+                skip_total=True,
             )
             items = result.get("items", [])
             if not items:
@@ -174,14 +334,23 @@ class ConversationService:
         self,
         conversation_id: str,
         limit: int = 50,
+        include_metadata: bool = False,
     ) -> list[MessageData]:
-        """Get conversation message history."""
+        """
+        Get conversation message history.
+
+        Only the MessageData fields are fetched; metadata blobs are skipped
+        unless include_metadata is set.
+        """
         try:
             result = await pocketbase.list_records(
                 "messages",
-                filter=f'conversation_id="{conversation_id}"',
+                filter=_CONVERSATION_MESSAGES_FILTER,
+                filter_params={"conversation": conversation_id},
                 sort="created",
                 per_page=limit,
+                fields=_HISTORY_FIELDS_WITH_METADATA if include_metadata else _HISTORY_FIELDS,
+                skip_total=True,
             )
             return [
                 MessageData(
@@ -190,7 +359,7 @@ class ConversationService:
                     role=record["role"],
                     content=record["content"],
                     agent_name=record.get("agent_name"),
-                    metadata=record.get("metadata", {}),
+                    metadata=(record.get("metadata") or {}) if include_metadata else {},
                 )
                 for record in result.get("items", [])
             ]
@@ -201,16 +370,49 @@ class ConversationService:
     async def complete_conversation(self, conversation_id: str) -> bool:
         """Mark conversation as completed."""
         try:
-            await pocketbase.update_record(
+            record = await pocketbase.update_record(
                 "conversations",
                 conversation_id,
                 {"status": "completed"},
             )
+            # The updated record carries the owner; only that user's cache is dropped
+            user_id = record.get("user_id")
+            if user_id is None:
+                user_id = next(
+                    (
+                        uid for uid, (_, conv) in self._active_conv_cache.items()
+                        if conv.id == conversation_id
+                    ),
+                    None,
+                )
+            if user_id is not None:
+                self._invalidate_active_conversation(user_id)
             return True
         except PocketbaseError as e:
             logger.error("Failed to complete conversation: %s", e.message)
             return False
 
+    async def _start_workflow(
+        self,
+        client: Client,
+        user_id: str,
+        workflow_id: str,
+    ) -> WorkflowHandle:
+        """
+        Start the user's onboarding workflow, or attach to the running one.
+
+        USE_EXISTING makes the start idempotent: if the workflow is running
+        its handle is returned; if it completed, a new run starts.
+        """
+        logger.debug("Starting or attaching to workflow: %s", workflow_id)
+        return await client.start_workflow(
+            OnboardingWorkflow.run,
+            args=[user_id, {}],
+            id=workflow_id,
+            task_queue=TASK_QUEUE,
+            id_conflict_policy=WorkflowIDConflictPolicy.USE_EXISTING,
+        )
+
     async def process_message(
         self,
         user_id: str,
@@ -245,7 +447,7 @@ class ConversationService:
             if websocket:
                 manager.register_user(user_id, websocket)
                 # Send "thinking" event immediately
-                await manager.send_personal(websocket, {"type": "thinking"})
+                await manager.send_raw(websocket, THINKING_FRAME)
 
             # 2. Get Temporal client
             client = await get_temporal_client()
@@ -253,80 +455,46 @@ class ConversationService:
             # 3. Build workflow ID for this user
             workflow_id = f"onboarding-{user_id}"
 
-            # 4. Try to get existing workflow or start new one
-            handle: Optional[WorkflowHandle] = None
-
-            try:
-                # Try to get existing workflow
+            # 4. Get the user's running workflow, starting one if needed
+            if workflow_id in self._known_workflows:
+                # Signalled successfully before - skip the start call
                 handle = client.get_workflow_handle(workflow_id)
-                # Verify it exists by querying state
-                await handle.query(OnboardingWorkflow.get_state)
-                logger.debug("Found existing workflow for user: %s", user_id)
-
-            except RPCError as e:
-                # Workflow doesn't exist, start new one
-                logger.info("Starting new onboarding workflow for user: %s", user_id)
-                handle = await client.start_workflow(
-                    OnboardingWorkflow.run,
-                    args=[user_id, {}],
-                    id=workflow_id,
-                    task_queue=TASK_QUEUE,
-                )
-                logger.info("Started workflow: %s", workflow_id)
-
-            except Exception as e:
-                # Other error - try to start anyway
-                logger.warning("Error checking workflow, starting new: %s", e)
-                try:
-                    handle = await client.start_workflow(
-                        OnboardingWorkflow.run,
-                        args=[user_id, {}],
-                        id=workflow_id,
-                        task_queue=TASK_QUEUE,
-                    )
-                except Exception as start_error:
-                    # Workflow might already exist, try to get handle
-                    logger.debug("Workflow may already exist: %s", start_error)
-                    handle = client.get_workflow_handle(workflow_id)
+            else:
+                handle = await self._start_workflow(client, user_id, workflow_id)
 
             # 5. Send user message signal to workflow
+            user_message = UserMessage(
+                content=message,
+                conversation_id=conversation_id,
+                request_id=request_id,
+            )
             # Wrap in try-catch to handle terminated/completed workflows
             try:
-                await handle.signal(
-                    OnboardingWorkflow.user_message,
-                    UserMessage(
-                        content=message,
-                        conversation_id=conversation_id,
-                        request_id=request_id,
-                    ),
-                )
+                await self._signal_user_message(handle, user_message)
+                self._remember_workflow(workflow_id)
                 logger.info(
                     "Sent message signal to workflow: %s (request_id=%s)",
                     workflow_id,
                     request_id,
                 )
             except RPCError as signal_error:
-                # Workflow might be completed/terminated, start a new one
-                if "already completed" in str(signal_error):
+                # Go through _start_workflow next time unless the restart below succeeds
+                self._known_workflows.pop(workflow_id, None)
+
+                # Workflow might be completed/terminated (or gone since it was
+                # cached as known, skipping the start call) - start a new one
+                if (
+                    "already completed" in str(signal_error)
+                    or signal_error.status == RPCStatusCode.NOT_FOUND
+                ):
                     logger.info(
                         "Workflow %s completed, starting new one",
                         workflow_id,
                     )
-                    handle = await client.start_workflow(
-                        OnboardingWorkflow.run,
-                        args=[user_id, {}],
-                        id=workflow_id,
-                        task_queue=TASK_QUEUE,
-                    )
+                    handle = await self._start_workflow(client, user_id, workflow_id)
                     # Signal the new workflow
-                    await handle.signal(
-                        OnboardingWorkflow.user_message,
-                        UserMessage(
-                            content=message,
-                            conversation_id=conversation_id,
-                            request_id=request_id,
-                        ),
-                    )
+                    await self._signal_user_message(handle, user_message)
+                    self._remember_workflow(workflow_id)
                     logger.info(
                         "Sent message signal to new workflow: %s (request_id=%s)",
                         workflow_id,
@@ -4,12 +4,20 @@ Database initialization for Pocketbase collections.
 Creates required system collections if they don't exist.
 """
 import logging
+import re
 from typing import Optional
 
 from src.services.pocketbase import pocketbase, PocketbaseError
 
 logger = logging.getLogger(__name__)
 
+# Collections created through the API (v0.23+) get no created/updated columns
+# unless autodate fields are declared; indexed and sorted collections declare them
+_AUTODATE_FIELDS = [
+    {"name": "created", "type": "autodate", "onCreate": True, "onUpdate": False},
+    {"name": "updated", "type": "autodate", "onCreate": True, "onUpdate": True},
+]
+
 # Collections required by the application
 # Pocketbase v0.20+ field format: for select fields, "values" is at field level
 SYSTEM_COLLECTIONS = {
@@ -69,8 +77,13 @@ SYSTEM_COLLECTIONS = {
                 "required": True,
                 "values": ["active", "completed"],
             },
+            *_AUTODATE_FIELDS,
+        ],
+        # get_active_conversation: user_id + status, newest first
+        # (leading user_id also serves plain user lookups)
+        "indexes": [
+            "CREATE INDEX idx_conv_user_status_created ON conversations (user_id, status, created)",
         ],
-        "indexes": ["CREATE INDEX idx_conv_user ON conversations (user_id)"],
     },
     "messages": {
         "name": "messages",
@@ -86,8 +99,12 @@ SYSTEM_COLLECTIONS = {
             {"name": "content", "type": "text", "required": True},
             {"name": "agent_name", "type": "text", "required": False},
             {"name": "metadata", "type": "json", "required": False},
+            *_AUTODATE_FIELDS,
+        ],
+        # get_history: conversation_id, ordered by created
+        "indexes": [
+            "CREATE INDEX idx_msg_conv_created ON messages (conversation_id, created)",
         ],
-        "indexes": ["CREATE INDEX idx_msg_conv ON messages (conversation_id)"],
     },
     "widget_instances": {
         "name": "widget_instances",
@@ -134,15 +151,72 @@ async def create_collection_if_not_exists(
         logger.debug("Collection '%s' already exists", name)
         return False
 
+    indexes = config.get("indexes")
     try:
-        await pocketbase.create_collection(name, config["fields"])
+        await pocketbase.create_collection(name, config["fields"], indexes)
         logger.info("Created collection: %s", name)
         return True
+    except PocketbaseError as e:
+        if not indexes:
+            logger.error("Failed to create collection '%s': %s", name, e.message)
+            return False
+        # An index Pocketbase rejects must not block the collection itself
+        logger.warning(
+            "Failed to create collection '%s' with indexes (%s), retrying without",
+            name,
+            e.message,
+        )
+
+    try:
+        await pocketbase.create_collection(name, config["fields"])
+        logger.info("Created collection without indexes: %s", name)
+        return True
     except PocketbaseError as e:
         logger.error("Failed to create collection '%s': %s", name, e.message)
         return False
 
 
+_INDEX_NAME = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?[`\"]?(\w+)",
+    re.IGNORECASE,
+)
+
+
+def _index_name(statement: str) -> Optional[str]:
+    """Extract the index name from a CREATE INDEX statement."""
+    match = _INDEX_NAME.search(statement)
+    return match.group(1) if match else None
+
+
+async def ensure_indexes(name: str, config: dict) -> int:
+    """
+    Add configured indexes missing from an existing collection.
+
+    Collections created before an index was added to SYSTEM_COLLECTIONS
+    do not get it from create_collection_if_not_exists.
+
+    Returns number of indexes added.
+    """
+    wanted = config.get("indexes") or []
+    if not wanted:
+        return 0
+
+    try:
+        collection = await pocketbase.get_collection(name)
+        current = collection.get("indexes") or []
+        present = {_index_name(statement) for statement in current}
+        missing = [s for s in wanted if _index_name(s) not in present]
+        if not missing:
+            return 0
+
+        await pocketbase.update_collection(name, {"indexes": current + missing})
+        logger.info("Added %d index(es) to collection: %s", len(missing), name)
+        return len(missing)
+    except PocketbaseError as e:
+        logger.error("Failed to update indexes for '%s': %s", name, e.message)
+        return 0
+
+
 async def init_database() -> tuple[int, int]:
     """
     Initialize all required database collections.
@@ -160,6 +234,7 @@ async def init_database() -> tuple[int, int]:
             created += 1
         else:
             skipped += 1
+            await ensure_indexes(name, config)
 
     logger.info(
         "Database initialization complete: %d created, %d already existed",
@@ -3,8 +3,16 @@ Mem0 Memory Service for long-term AI memory.
 
 Provides a wrapper around Mem0 for storing and retrieving user memories
 that persist across sessions.
+
+The Mem0 SDK is synchronous (embedding and vector store calls block), so
+its calls run in a worker thread to keep the event loop free.
 """
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional
 
 from mem0 import Memory
@@ -13,6 +21,102 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Search results cache: user_id -> {(normalized query, limit): (timestamp, memories)}.
+# Profile and workflow pages repeat the same searches; add() drops the user's
+# entries in O(1). The cache is per process: after an add() handled by another
+# worker, this one may serve the old results for up to the TTL.
+_SEARCH_CACHE_TTL_SECONDS = 60.0
+_SEARCH_CACHE_MAX_USERS = 1_000
+_SEARCH_CACHE_MAX_PER_USER = 16
+_search_cache: OrderedDict[
+    str, OrderedDict[tuple[str, int], tuple[float, list[str]]]
+] = OrderedDict()
+# Bumped on invalidation so searches started before an add() are not cached
+_user_generations: dict[str, int] = {}
+
+
+# Caps concurrent Mem0 calls (provider rate limits, worker threads)
+_mem0_semaphore = asyncio.Semaphore(settings.mem0_max_concurrency)
+
+# Mem0 client shared by all MemoryService instances (built once, warmed at startup)
+_shared_memory: Optional[Memory] = None
+_shared_memory_lock = threading.Lock()
+# A failed build is remembered for this long so callers fail fast instead of
+# re-running the blocking Memory.from_config on every call
+_INIT_RETRY_SECONDS = 30.0
+_init_failure: Optional[tuple[float, str]] = None
+
+
+def _get_shared_memory() -> Memory:
+    """
+    Return the shared Mem0 client, creating it on first use.
+
+    Raises:
+        MemoryServiceError: If the client failed to build within the retry window
+    """
+    global _shared_memory, _init_failure
+
+    if _shared_memory is not None:
+        return _shared_memory
+
+    # Builds run in worker threads; the lock keeps concurrent first calls to one client
+    with _shared_memory_lock:
+        if _shared_memory is not None:
+            return _shared_memory
+        if _init_failure is not None and time.monotonic() - _init_failure[0] < _INIT_RETRY_SECONDS:
+            raise MemoryServiceError(_init_failure[1])
+        try:
+            _shared_memory = Memory.from_config(settings.get_mem0_config())
+        except Exception as e:
+            _init_failure = (time.monotonic(), str(e))
+            raise
+        _init_failure = None
+    return _shared_memory
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize query text for cache keys (case and whitespace)."""
+    return " ".join(query.lower().split())
+
+
+def _get_cached_search(key: tuple[str, str, int]) -> Optional[list[str]]:
+    """Return cached search results if present and fresh."""
+    user_id, query, limit = key
+    entries = _search_cache.get(user_id)
+    if entries is None:
+        return None
+    entry = entries.get((query, limit))
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= _SEARCH_CACHE_TTL_SECONDS:
+        del entries[(query, limit)]
+        return None
+    entries.move_to_end((query, limit))
+    _search_cache.move_to_end(user_id)
+    return list(entry[1])
+
+
+def _put_cached_search(key: tuple[str, str, int], memories: list[str]) -> None:
+    """Store search results, evicting the least recently used user/query."""
+    user_id, query, limit = key
+    entries = _search_cache.get(user_id)
+    if entries is None:
+        entries = _search_cache[user_id] = OrderedDict()
+        if len(_search_cache) > _SEARCH_CACHE_MAX_USERS:
+            _search_cache.popitem(last=False)
+    _search_cache.move_to_end(user_id)
+
+    entries[(query, limit)] = (time.monotonic(), list(memories))
+    entries.move_to_end((query, limit))
+    if len(entries) > _SEARCH_CACHE_MAX_PER_USER:
+        entries.popitem(last=False)
+
+
+def _invalidate_user_searches(user_id: str) -> None:
+    """Drop cached searches for a user after their memories change."""
+    _user_generations[user_id] = _user_generations.get(user_id, 0) + 1
+    _search_cache.pop(user_id, None)
+
 
 class MemoryServiceError(Exception):
     """Exception for memory service errors."""
@@ -54,17 +158,27 @@ class MemoryService:
             return self._memory is not None
 
         try:
-            config = settings.get_mem0_config()
-            self._memory = Memory.from_config(config)
+            self._memory = _get_shared_memory()
             self._initialized = True
             logger.debug("Mem0 initialized for user %s", self.user_id)
             return True
+        except MemoryServiceError as e:
+            # Still inside the retry window of an earlier failure
+            self._init_error = e.message
+            return False
         except Exception as e:
+            # Not marked initialized: instances are shared per user
+            # (get_memory_service), so a call after the retry window retries
             self._init_error = str(e)
-            self._initialized = True  # Mark as attempted
             logger.error("Failed to initialize Mem0: %s", e)
             return False
 
+    async def _ensure_initialized_async(self) -> bool:
+        """Initialize Mem0 in a worker thread; client construction is blocking."""
+        if self._initialized:
+            return self._memory is not None
+        return await asyncio.to_thread(self._ensure_initialized)
+
     async def add(self, messages: list[dict]) -> list[dict]:
         """
         Add messages to memory. Mem0 will extract important information.
@@ -77,12 +191,14 @@ class MemoryService:
         Returns:
             List of extracted memories (for logging/debugging)
         """
-        if not self._ensure_initialized():
+        if not await self._ensure_initialized_async():
             logger.warning("Memory service not available, skipping add")
             return []
 
         try:
-            result = self._memory.add(messages, user_id=self.user_id)
+            async with _mem0_semaphore:
+                result = await asyncio.to_thread(self._memory.add, messages, user_id=self.user_id)
+            _invalidate_user_searches(self.user_id)
 
             # Extract memories from result
             memories = []
@@ -118,12 +234,21 @@ class MemoryService:
         Returns:
             List of memory strings, sorted by relevance
         """
-        if not self._ensure_initialized():
+        cache_key = (self.user_id, _normalize_query(query), limit)
+        cached = _get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+
+        if not await self._ensure_initialized_async():
             logger.warning("Memory service not available, returning empty results")
             return []
 
+        generation = _user_generations.get(self.user_id, 0)
         try:
-            results = self._memory.search(query, user_id=self.user_id, limit=limit)
+            async with _mem0_semaphore:
+                results = await asyncio.to_thread(
+                    self._memory.search, query, user_id=self.user_id, limit=limit
+                )
 
             # Extract memory text from results
             memories = []
@@ -149,6 +274,9 @@ class MemoryService:
                 len(memories),
                 self.user_id,
             )
+            # Empty results are not cached: new memories may still be indexing
+            if memories and _user_generations.get(self.user_id, 0) == generation:
+                _put_cached_search(cache_key, memories)
             return memories
         except Exception as e:
             logger.error("Failed to search memories: %s", e)
@@ -164,12 +292,13 @@ class MemoryService:
         Returns:
             List of memory strings
         """
-        if not self._ensure_initialized():
+        if not await self._ensure_initialized_async():
             logger.warning("Memory service not available, returning empty results")
             return []
 
         try:
-            results = self._memory.get_all(user_id=self.user_id)
+            async with _mem0_semaphore:
+                results = await asyncio.to_thread(self._memory.get_all, user_id=self.user_id)
 
             # Extract memory text from results
             memories = []
@@ -204,6 +333,17 @@ class MemoryService:
         return self._ensure_initialized()
 
 
+@lru_cache(maxsize=1024)
+def get_memory_service(user_id: str) -> MemoryService:
+    """Return a reused MemoryService for the user."""
+    return MemoryService(user_id=user_id)
+
+
+def clear_memory_services() -> None:
+    """Drop cached per-user MemoryService instances."""
+    get_memory_service.cache_clear()
+
+
 async def check_memory_service() -> tuple[bool, str]:
     """
     Check if memory service is working.
@@ -213,7 +353,8 @@ async def check_memory_service() -> tuple[bool, str]:
     """
     try:
         service = MemoryService(user_id="__health_check__")
-        if service.is_available:
+        # Mem0 client construction is blocking; keep it off the event loop
+        if await asyncio.to_thread(lambda: service.is_available):
             return True, "Mem0 initialized successfully"
         else:
             return False, f"Mem0 initialization failed: {service._init_error}"
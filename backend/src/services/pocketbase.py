@@ -1,4 +1,6 @@
 import logging
+import re
+import time
 from typing import Any, Optional
 
 import httpx
@@ -7,6 +9,10 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Collection list is read per agent turn but changes rarely;
+# create_collection() invalidates it.
+_COLLECTIONS_TTL_SECONDS = 30.0
+
 
 class PocketbaseError(Exception):
     """Custom exception for Pocketbase errors."""
@@ -17,12 +23,55 @@ class PocketbaseError(Exception):
         super().__init__(self.message)
 
 
+def _filter_literal(value: Any) -> str:
+    """Render a Python value as a Pocketbase filter literal."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    text = str(value)
+    # The filter tokenizer only unescapes \' - a trailing backslash would
+    # escape the closing quote, and a doubled one is matched literally
+    if text.endswith("\\"):
+        raise PocketbaseError("Filter value cannot end with a backslash")
+    return "'" + text.replace("'", "\\'") + "'"
+
+
+_PLACEHOLDER = re.compile(r"\{:(\w+)\}")
+
+
+def build_filter(expression: str, params: Optional[dict[str, Any]] = None) -> str:
+    """
+    Bind named placeholders in a Pocketbase filter expression.
+
+    Mirrors the official SDK's pb.filter(): placeholders use the {:name}
+    syntax and quotes in values are escaped, so user input cannot change the
+    filter structure and the expression itself can be a module-level constant.
+    Values ending in a backslash are rejected with PocketbaseError.
+
+    Example:
+        build_filter("user_id={:user} && status={:status}", {"user": uid, "status": "new"})
+    """
+    if not params:
+        return expression
+
+    def bind(match: re.Match) -> str:
+        key = match.group(1)
+        return _filter_literal(params[key]) if key in params else match.group(0)
+
+    # Single pass over the original expression: bound values are never rescanned
+    return _PLACEHOLDER.sub(bind, expression)
+
+
 class PocketbaseService:
     """Async client for Pocketbase REST API with admin authentication."""
 
     def __init__(self, base_url: Optional[str] = None):
         self.base_url = (base_url or settings.pocketbase_url).rstrip("/")
         self._admin_token: Optional[str] = None
+        self._collections_cache: Optional[tuple[float, list[dict]]] = None
 
     async def _ensure_admin_auth(self) -> Optional[str]:
         """
@@ -119,15 +168,30 @@ class PocketbaseService:
     # ==================== Collections ====================
 
     async def list_collections(self) -> list[dict]:
-        """Get list of all collections (requires admin auth)."""
+        """Get list of all collections (requires admin auth, cached briefly)."""
+        cached = self._collections_cache
+        if cached is not None and time.monotonic() - cached[0] < _COLLECTIONS_TTL_SECONDS:
+            return list(cached[1])
+
         result = await self._request("GET", "/api/collections", require_admin=True)
-        return result.get("items", []) if result else []
+        items = result.get("items", []) if result else []
+        self._collections_cache = (time.monotonic(), items)
+        return list(items)
+
+    def invalidate_collections(self) -> None:
+        """Drop the cached collection list (after schema changes)."""
+        self._collections_cache = None
 
     async def get_collection(self, name: str) -> dict:
         """Get collection info by name (requires admin auth)."""
         return await self._request("GET", f"/api/collections/{name}", require_admin=True)
 
-    async def create_collection(self, name: str, schema: list[dict]) -> dict:
+    async def create_collection(
+        self,
+        name: str,
+        schema: list[dict],
+        indexes: Optional[list[str]] = None,
+    ) -> dict:
         """Create a new collection (requires admin auth)."""
         data = {
             "name": name,
@@ -140,7 +204,21 @@ class PocketbaseService:
             "updateRule": "",
             "deleteRule": "",
         }
-        return await self._request("POST", "/api/collections", json=data, require_admin=True)
+        if indexes:
+            data["indexes"] = indexes
+        try:
+            return await self._request("POST", "/api/collections", json=data, require_admin=True)
+        finally:
+            self.invalidate_collections()
+
+    async def update_collection(self, name: str, data: dict) -> dict:
+        """Update collection settings, e.g. indexes (requires admin auth)."""
+        try:
+            return await self._request(
+                "PATCH", f"/api/collections/{name}", json=data, require_admin=True
+            )
+        finally:
+            self.invalidate_collections()
 
     # ==================== Records ====================
 
@@ -151,13 +229,26 @@ class PocketbaseService:
         sort: Optional[str] = None,
         page: int = 1,
         per_page: int = 50,
+        filter_params: Optional[dict[str, Any]] = None,
+        fields: Optional[str] = None,
+        skip_total: bool = False,
     ) -> dict:
-        """Get list of records from a collection."""
+        """
+        Get list of records from a collection.
+
+        `filter` may contain {:name} placeholders bound from `filter_params`.
+        `fields` limits the returned record fields (e.g. "id").
+        `skip_total` skips the server-side COUNT (totalItems/totalPages = -1).
+        """
         params = {"page": page, "perPage": per_page}
         if filter:
-            params["filter"] = filter
+            params["filter"] = build_filter(filter, filter_params)
         if sort:
             params["sort"] = sort
+        if fields:
+            params["fields"] = fields
+        if skip_total:
+            params["skipTotal"] = 1
 
         return await self._request("GET", f"/api/collections/{collection}/records", params=params)
 
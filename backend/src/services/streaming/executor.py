@@ -50,33 +50,35 @@ class StreamExecutor:
         """
         model = self._agent_provider._resolve_model(config.model)
 
+        # Static base prompt first (cacheable prefix), then memories,
+        # then volatile collections
         agent: Agent[AgentDeps, str] = Agent(
             model=model,
             deps_type=AgentDeps,
             # No output_type = text-only output
+            system_prompt=config.system_prompt,
         )
 
+        @agent.system_prompt
+        async def memory_system_prompt(ctx) -> str:
+            agent_deps: AgentDeps = ctx.deps
+            return agent_deps.get_memories_summary()
+
         # Add system prompt for streaming (text-only, no workflow signals)
         @agent.system_prompt
         async def streaming_system_prompt(ctx) -> str:
             agent_deps: AgentDeps = ctx.deps
-            base_prompt = config.system_prompt
 
             # NO workflow_prompt - streaming agent is for text output only
             # Workflow signals are handled separately after streaming completes
 
             # Get data context
             collections_summary = agent_deps.get_collections_summary()
-            memories_summary = agent_deps.get_memories_summary()
 
-            return f"""{base_prompt}
-
-## Available Data
+            return f"""## Available Data
 
 {collections_summary}
 
-{memories_summary}
-
 Respond naturally to the user. Focus on the conversation content.
 """
 
@@ -116,9 +118,10 @@ Respond naturally to the user. Focus on the conversation content.
                 request.agent_name,
             )
 
+            # delta=True yields only new text, no re-diffing of the accumulated buffer
             async with agent.run_stream(request.user_message, deps=deps) as stream:
-                async for accumulated_text in stream.stream_text():
-                    yield state.update_from_accumulated(accumulated_text)
+                async for delta in stream.stream_text(delta=True):
+                    yield state.append(delta)
 
             logger.info(
                 "Stream completed for request %s, total chars: %d",
@@ -40,7 +40,7 @@ async def search_memories(input: MemorySearchInput) -> list[str]:
     Returns:
         List of relevant memory strings
     """
-    from src.services.memory import MemoryService
+    from src.services.memory import get_memory_service
 
     logger.debug(
         "Searching memories for user '%s' with query: %s",
@@ -49,7 +49,7 @@ async def search_memories(input: MemorySearchInput) -> list[str]:
     )
 
     try:
-        memory_service = MemoryService(user_id=input.user_id)
+        memory_service = get_memory_service(input.user_id)
         memories = await memory_service.search(query=input.query, limit=input.limit)
 
         logger.info(
@@ -76,7 +76,7 @@ async def add_memory(input: MemoryAddInput) -> list[dict]:
     Returns:
         List of extracted memory dicts
     """
-    from src.services.memory import MemoryService
+    from src.services.memory import get_memory_service
 
     if not input.messages:
         logger.debug("No messages to add to memory")
@@ -89,7 +89,7 @@ async def add_memory(input: MemoryAddInput) -> list[dict]:
     )
 
     try:
-        memory_service = MemoryService(user_id=input.user_id)
+        memory_service = get_memory_service(input.user_id)
         result = await memory_service.add(messages=input.messages)
 
         logger.info(
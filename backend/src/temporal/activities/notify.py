@@ -33,7 +33,7 @@ async def notify_user(input: NotifyInput) -> bool:
         input: Notification parameters
 
     Returns:
-        True if notification was sent, False otherwise
+        True if the event was queued on a user connection, False otherwise
     """
     from src.services.connection_manager import manager
 
@@ -55,7 +55,7 @@ async def notify_user(input: NotifyInput) -> bool:
 
         if sent:
             logger.info(
-                "Sent '%s' event to user '%s'",
+                "Queued '%s' event for user '%s'",
                 input.event_type,
                 input.user_id,
             )
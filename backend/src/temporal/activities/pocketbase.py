@@ -12,6 +12,11 @@ from temporalio import activity
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM_COLLECTIONS = frozenset(
+    {"users", "agents", "conversations", "messages", "workflow_instances", "widget_instances"}
+)
+_ACTIVE_CONVERSATION_FILTER = 'user_id={:user} && status="active"'
+
 
 @dataclass
 class CreateWorkflowInput:
@@ -225,10 +230,9 @@ async def get_user_collections(user_id: str) -> list[dict]:
         collections = await pocketbase.list_collections()
 
         # Filter out system collections
-        system_collections = {"users", "agents", "conversations", "messages", "workflow_instances", "widget_instances"}
         user_collections = [
             c for c in collections
-            if c.get("name") not in system_collections
+            if c.get("name") not in _SYSTEM_COLLECTIONS
         ]
 
         logger.debug("Found %d user collections", len(user_collections))
@@ -260,10 +264,15 @@ async def get_or_create_conversation(user_id: str, workflow_instance_id: str) ->
     )
 
     try:
-        # Try to find active conversation
+        # Try to find active conversation (one id, no COUNT query)
         result = await pocketbase.list_records(
             "conversations",
-            filter=f'user_id="{user_id}" && status="active"',
+            filter=_ACTIVE_CONVERSATION_FILTER,
+            filter_params={"user": user_id},
+            sort="-created",
+            per_page=1,
+            fields="id",
+            skip_total=True,
         )
         records = result.get("items", [])
 
@@ -3,6 +3,7 @@ Temporal Client singleton.
 
 Provides a shared Temporal client for the entire application.
 """
+import asyncio
 import logging
 from typing import Optional
 
@@ -13,6 +14,7 @@ from src.config import settings
 logger = logging.getLogger(__name__)
 
 _client: Optional[Client] = None
+_client_lock = asyncio.Lock()
 
 
 async def get_temporal_client() -> Client:
@@ -24,10 +26,16 @@ async def get_temporal_client() -> Client:
     """
     global _client
 
-    if _client is None:
-        logger.info("Connecting to Temporal server at %s", settings.temporal_host)
-        _client = await Client.connect(settings.temporal_host)
-        logger.info("Connected to Temporal server")
+    if _client is not None:
+        return _client
+
+    # Worker startup and the first API request can race to connect;
+    # serialize so only one channel is ever opened.
+    async with _client_lock:
+        if _client is None:
+            logger.info("Connecting to Temporal server at %s", settings.temporal_host)
+            _client = await Client.connect(settings.temporal_host)
+            logger.info("Connected to Temporal server")
 
     return _client
 
@@ -7,6 +7,7 @@ Guides new users through the onboarding process:
 3. brain_dump - Collect thoughts with inbox_collector agent
 4. setup_complete - Finish with coordinator agent
 """
+import asyncio
 import logging
 from dataclasses import dataclass, field, asdict
 from datetime import timedelta
@@ -71,6 +72,11 @@ class UserMessage:
     request_id: Optional[str] = None  # For streaming support
 
 
+# Workflow versioning markers (workflow.patched) for concurrent activities
+_PARALLEL_CONTEXT_LOAD_PATCH = "parallel-context-load"  # user message + memories + collections
+_PARALLEL_TURN_PERSIST_PATCH = "parallel-turn-persist"  # assistant message + memory
+
+
 # Step configuration
 ONBOARDING_STEPS = {
     "greeting": {
@@ -119,6 +125,11 @@ class OnboardingWorkflow(StreamingMixin):
         """Receive user message from API."""
         self.pending_messages.append(message)
 
+    @workflow.signal
+    async def user_messages(self, messages: list[UserMessage]) -> None:
+        """Receive user messages the API coalesced into one signal."""
+        self.pending_messages.extend(messages)
+
     @workflow.signal
     async def user_connected(self) -> None:
         """Handle user connection event."""
@@ -276,33 +287,19 @@ class OnboardingWorkflow(StreamingMixin):
         # Increment message counter
         self.state.messages_in_step += 1
 
-        # Save user message
-        await workflow.execute_activity(
-            save_message,
-            SaveMessageInput(
-                conversation_id=self.state.conversation_id,
-                role="user",
-                content=message.content,
-            ),
-            start_to_close_timeout=timedelta(seconds=30),
-        )
-
-        # Load context for agent
-        memories = await workflow.execute_activity(
-            search_memories,
-            MemorySearchInput(
-                user_id=self.state.user_id,
-                query=message.content,
-                limit=5,
-            ),
-            start_to_close_timeout=timedelta(seconds=30),
-        )
-
-        collections = await workflow.execute_activity(
-            get_user_collections,
-            args=[self.state.user_id],
-            start_to_close_timeout=timedelta(seconds=30),
-        )
+        # Save user message and load context for agent
+        if workflow.patched(_PARALLEL_CONTEXT_LOAD_PATCH):
+            # Nothing in this turn reads the saved message - write it alongside
+            _, memories, collections = await asyncio.gather(
+                self._save_user_message(message.content),
+                self._search_memories(message.content),
+                self._load_collections(),
+            )
+        else:
+            # Histories recorded before the patch ran these in sequence
+            await self._save_user_message(message.content)
+            memories = await self._search_memories(message.content)
+            collections = await self._load_collections()
 
         # Build workflow context for agent
         workflow_context = {
@@ -338,33 +335,78 @@ class OnboardingWorkflow(StreamingMixin):
                 memories=memories,
             )
 
-        # Save assistant message
+        # Persist the turn: assistant message (Pocketbase) and memory (Mem0).
+        # Both finish before _process_signal - memory criteria read Mem0.
+        if workflow.patched(_PARALLEL_TURN_PERSIST_PATCH):
+            await asyncio.gather(
+                self._save_assistant_message(agent_result.content, step_config),
+                self._add_memory(message.content, agent_result.content),
+            )
+        else:
+            await self._save_assistant_message(agent_result.content, step_config)
+            await self._add_memory(message.content, agent_result.content)
+
+        # Process workflow signal
+        await self._process_signal(agent_result.workflow_signal, step_config)
+
+    async def _save_user_message(self, content: str) -> None:
+        """Save the user message to the conversation."""
+        await workflow.execute_activity(
+            save_message,
+            SaveMessageInput(
+                conversation_id=self.state.conversation_id,
+                role="user",
+                content=content,
+            ),
+            start_to_close_timeout=timedelta(seconds=30),
+        )
+
+    async def _save_assistant_message(self, content: str, step_config: dict) -> None:
+        """Save the agent reply to the conversation."""
         await workflow.execute_activity(
             save_message,
             SaveMessageInput(
                 conversation_id=self.state.conversation_id,
                 role="assistant",
-                content=agent_result.content,
+                content=content,
                 agent_name=step_config.get("agent", "coordinator"),
             ),
             start_to_close_timeout=timedelta(seconds=30),
         )
 
-        # Add to memory
+    async def _add_memory(self, user_content: str, assistant_content: str) -> None:
+        """Send the exchange to Mem0 for fact extraction."""
         await workflow.execute_activity(
             add_memory,
             MemoryAddInput(
                 user_id=self.state.user_id,
                 messages=[
-                    {"role": "user", "content": message.content},
-                    {"role": "assistant", "content": agent_result.content},
+                    {"role": "user", "content": user_content},
+                    {"role": "assistant", "content": assistant_content},
                 ],
             ),
             start_to_close_timeout=timedelta(seconds=30),
         )
 
-        # Process workflow signal
-        await self._process_signal(agent_result.workflow_signal, step_config)
+    async def _search_memories(self, query: str) -> list:
+        """Search user memories relevant to the message."""
+        return await workflow.execute_activity(
+            search_memories,
+            MemorySearchInput(
+                user_id=self.state.user_id,
+                query=query,
+                limit=5,
+            ),
+            start_to_close_timeout=timedelta(seconds=30),
+        )
+
+    async def _load_collections(self) -> list:
+        """Load the user's collections for agent context."""
+        return await workflow.execute_activity(
+            get_user_collections,
+            args=[self.state.user_id],
+            start_to_close_timeout=timedelta(seconds=30),
+        )
 
     async def _process_with_streaming(
         self,
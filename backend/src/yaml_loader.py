@@ -0,0 +1,61 @@
+"""
+YAML file loading shared by the agent and workflow config loaders.
+
+Uses the libyaml C loader when available and parses files concurrently.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+import yaml
+
+# libyaml C loader when available (much faster than the pure-Python one)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+YAML_SUFFIXES = (".yaml", ".yml")
+# Upper bound for concurrent file reads/parses
+MAX_PARSE_WORKERS = 8
+
+T = TypeVar("T")
+
+
+def load_yaml(path: Path | str) -> Any:
+    """Read and parse one YAML file."""
+    # libyaml reads bytes directly (UTF-8 detected), no text decode layer
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def list_yaml_files(directory: Path) -> list[Path]:
+    """List *.yaml / *.yml files in a directory with a single scan (sorted)."""
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(YAML_SUFFIXES) and entry.is_file()
+        )
+
+
+def parse_files(
+    paths: list[Path], parse: Callable[[Path], T]
+) -> list[tuple[Path, T | Exception]]:
+    """
+    Parse files concurrently, preserving input order.
+
+    A failing file yields its exception instead of aborting the others.
+    """
+    if not paths:
+        return []
+
+    def parse_one(path: Path) -> T | Exception:
+        try:
+            return parse(path)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(paths))) as pool:
+        return list(zip(paths, pool.map(parse_one, paths)))
@@ -172,6 +172,83 @@ class TestConversationService:
         assert result.success is True
         assert result.response == "AI response"
 
+    @pytest.mark.asyncio
+    async def test_active_conversation_is_cached_and_invalidated(self):
+        """Test concurrent lookups share one query and completion invalidates."""
+        from unittest.mock import AsyncMock, patch
+        from src.services.conversation import ConversationService
+
+        record = {"id": "conv-1", "user_id": "user-1", "status": "active"}
+        service = ConversationService()
+
+        with patch("src.services.conversation.pocketbase") as pb:
+            pb.list_records = AsyncMock(return_value={"items": [record]})
+            pb.update_record = AsyncMock(return_value={**record, "status": "completed"})
+
+            first, second = await asyncio.gather(
+                service.get_active_conversation("user-1"),
+                service.get_active_conversation("user-1"),
+            )
+            cached = await service.get_active_conversation("user-1")
+            assert first.id == second.id == cached.id == "conv-1"
+            assert pb.list_records.await_count == 1
+            await service.get_active_conversation("user-2")
+            assert pb.list_records.await_count == 2
+
+            # Only the owner's cache entry is dropped
+            await service.complete_conversation("conv-1")
+            await service.get_active_conversation("user-2")
+            assert pb.list_records.await_count == 2
+            await service.get_active_conversation("user-1")
+            assert pb.list_records.await_count == 3
+
+    def test_known_workflows_are_bounded(self):
+        """Test remembered workflow IDs evict the least recently used one."""
+        from unittest.mock import patch
+        from src.services.conversation import ConversationService
+
+        service = ConversationService()
+        with patch("src.services.conversation._KNOWN_WORKFLOWS_MAX", 2):
+            for workflow_id in ("wf-1", "wf-2", "wf-1", "wf-3"):
+                service._remember_workflow(workflow_id)
+
+        assert list(service._known_workflows) == ["wf-1", "wf-3"]
+
+    @pytest.mark.asyncio
+    async def test_burst_messages_coalesce_into_batch_signal(self):
+        """Test messages sent while a signal is in flight share one batch signal."""
+        from unittest.mock import MagicMock
+        from src.services.conversation import ConversationService
+        from src.temporal.workflows.onboarding import OnboardingWorkflow, UserMessage
+
+        release = asyncio.Event()
+        calls = []
+
+        async def signal(handler, payload):
+            calls.append((handler, payload))
+            if len(calls) == 1:
+                await release.wait()
+
+        handle = MagicMock()
+        handle.id = "onboarding-user-1"
+        handle.signal = signal
+        service = ConversationService()
+
+        first = asyncio.create_task(service._signal_user_message(handle, UserMessage(content="a")))
+        await asyncio.sleep(0)
+        rest = [
+            asyncio.create_task(service._signal_user_message(handle, UserMessage(content=c)))
+            for c in ("b", "c")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, *rest)
+
+        assert calls[0] == (OnboardingWorkflow.user_message, UserMessage(content="a"))
+        assert calls[1][0] == OnboardingWorkflow.user_messages
+        assert [m.content for m in calls[1][1]] == ["b", "c"]
+        assert len(calls) == 2
+
 
 class TestWidgetService:
     """Tests for WidgetService data structures."""
@@ -211,6 +288,19 @@ class TestDatabaseCollections:
             assert name in SYSTEM_COLLECTIONS
             assert "fields" in SYSTEM_COLLECTIONS[name]
 
+    def test_index_columns_are_declared_fields(self):
+        """Test every indexed column exists on its collection."""
+        import re
+
+        from src.services.db_init import SYSTEM_COLLECTIONS
+
+        for name, config in SYSTEM_COLLECTIONS.items():
+            fields = {field["name"] for field in config["fields"]} | {"id"}
+            for statement in config.get("indexes", []):
+                columns = re.search(r"\((.*)\)", statement).group(1)
+                for column in columns.split(","):
+                    assert column.strip() in fields, f"{name}: {column.strip()} not declared"
+
 
 class TestMemoryService:
     """Tests for MemoryService structure."""
@@ -222,6 +312,44 @@ class TestMemoryService:
         service = MemoryService(user_id="test-user")
         assert service.user_id == "test-user"
 
+    def test_search_cache_normalizes_and_invalidates(self):
+        """Test search cache keys ignore case/whitespace and add() invalidates."""
+        from src.services import memory
+
+        key = ("cache-user", memory._normalize_query("  Workouts   PLAN "), 5)
+        assert key[1] == "workouts plan"
+
+        memory._put_cached_search(key, ["likes running"])
+        assert memory._get_cached_search(key) == ["likes running"]
+
+        memory._invalidate_user_searches("cache-user")
+        assert memory._get_cached_search(key) is None
+
+    def test_memory_service_reused_per_user(self):
+        """Test get_memory_service returns one shared instance per user."""
+        from src.services.memory import clear_memory_services, get_memory_service
+
+        clear_memory_services()
+        first = get_memory_service("user-1")
+
+        assert get_memory_service("user-1") is first
+        assert get_memory_service("user-2") is not first
+
+        clear_memory_services()
+        assert get_memory_service("user-1") is not first
+
+    def test_failed_init_is_not_retried_within_window(self):
+        """Test a failed Mem0 build fails fast until the retry window passes."""
+        from unittest.mock import patch
+        from src.services import memory
+
+        with patch.object(memory, "_shared_memory", None), \
+                patch.object(memory, "_init_failure", None), \
+                patch.object(memory.Memory, "from_config", side_effect=RuntimeError("down")) as build:
+            assert memory.MemoryService("user-1").is_available is False
+            assert memory.MemoryService("user-2").is_available is False
+            assert build.call_count == 1
+
 
 class TestAPIEndpoints:
     """Tests for API endpoint definitions."""
@@ -268,5 +396,108 @@ class TestAPIEndpoints:
         assert instance.current_step == "greeting"
 
 
+class TestSystemPrompts:
+    """Tests for tiered system prompt construction."""
+
+    def test_static_instructions_have_no_placeholders(self):
+        """Test static tier contains no per-request context."""
+        from src.ai.prompts import build_static_instructions
+
+        instructions = build_static_instructions()
+        assert "{context}" not in instructions
+        assert '{"title": "Купить молоко", "done": false}' in instructions
+
+    def test_volatile_prompt_carries_request_context(self):
+        """Test volatile tier holds collections and workflow state, in that order."""
+        from src.ai.prompts import (
+            CONTEXT_HEADER,
+            build_static_instructions,
+            build_volatile_prompt,
+        )
+
+        volatile = build_volatile_prompt("- tasks: title", "Step: greeting\n")
+        assert volatile == f"{CONTEXT_HEADER}\n\n- tasks: title\n\nStep: greeting"
+        assert "- tasks: title" not in build_static_instructions()
+
+
+class TestPocketbaseFilter:
+    """Tests for parameterized Pocketbase filters."""
+
+    def test_build_filter_binds_params(self):
+        """Test placeholders are replaced with escaped literals."""
+        from src.services.pocketbase import build_filter
+
+        result = build_filter(
+            "user_id={:user} && status={:status} && count>{:n}",
+            {"user": "o'neil", "status": None, "n": 3},
+        )
+        assert result == "user_id='o\\'neil' && status=null && count>3"
+
+    def test_build_filter_without_params(self):
+        """Test expression is returned unchanged without params."""
+        from src.services.pocketbase import build_filter
+
+        assert build_filter('status="new"') == 'status="new"'
+
+    def test_build_filter_does_not_rescan_bound_values(self):
+        """Test a value that looks like a placeholder is bound literally."""
+        from src.services.pocketbase import build_filter
+
+        result = build_filter(
+            "user_id={:user} && status={:status}",
+            {"user": "{:status}", "status": "active"},
+        )
+        assert result == "user_id='{:status}' && status='active'"
+
+    def test_build_filter_keeps_inner_backslash(self):
+        """Test backslashes are passed through and a trailing one is rejected."""
+        from src.services.pocketbase import PocketbaseError, build_filter
+
+        assert build_filter("title={:title}", {"title": "a\\b"}) == "title='a\\b'"
+
+        with pytest.raises(PocketbaseError):
+            build_filter("title={:title}", {"title": "abc\\"})
+
+
+class TestConnectionManager:
+    """Tests for WebSocket send batching."""
+
+    def test_batch_frame_wraps_encoded_events(self):
+        """Test batch frame is valid JSON containing events in order."""
+        import json
+
+        from src.services.connection_manager import _encode, _encode_batch
+
+        frames = [_encode({"type": "thinking"}), _encode({"type": "stream.chunk", "n": 1})]
+        batch = json.loads(_encode_batch(frames))
+
+        assert batch["type"] == "batch"
+        assert batch["events"] == [{"type": "thinking"}, {"type": "stream.chunk", "n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_disconnects_slow_client(self):
+        """Test a client whose send queue is full is disconnected, not skipped."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from src.services.connection_manager import ConnectionManager
+
+        websocket = MagicMock()
+        websocket.accept = AsyncMock()
+        websocket.close = AsyncMock()
+        manager = ConnectionManager()
+
+        with patch("src.services.connection_manager.SEND_QUEUE_MAX", 1):
+            await manager.connect(websocket)
+        manager.register_user("user-1", websocket)
+
+        # Writer task has not run yet, so the second frame overflows the queue
+        assert await manager.send_to_user("user-1", {"type": "thinking"}) is True
+        assert await manager.send_to_user("user-1", {"type": "thinking"}) is False
+        await asyncio.sleep(0)
+
+        assert not manager.is_user_connected("user-1")
+        assert websocket not in manager.active_connections
+        websocket.close.assert_awaited_once_with(code=1013)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
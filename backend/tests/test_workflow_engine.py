@@ -9,6 +9,7 @@ Tests the workflow-agent integration:
 """
 import pytest
 import sys
+from contextlib import asynccontextmanager, nullcontext
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -221,6 +222,21 @@ class TestWorkflowContext:
 
         assert prompt == ""
 
+    def test_memory_pack_is_order_independent(self):
+        """Test memory pack renders the same text regardless of input order."""
+        from src.ai.context import AgentContext, AgentDeps
+
+        def summary(memories: list[str]) -> str:
+            context = AgentContext(user_id="user-1", memories=memories)
+            return AgentDeps(user_id="user-1", context=context).get_memories_summary()
+
+        first = summary(["likes tea", "works remotely"])
+        second = summary(["works remotely", "likes tea"])
+
+        assert first == second
+        assert "<memories v=" in first
+        assert first != summary(["likes coffee", "works remotely"])
+
 
 class TestAgentServiceWorkflow:
     """Tests for AgentService workflow methods."""
@@ -281,6 +297,18 @@ class TestWorkflowServiceMethods:
         assert config is not None
         assert config["initial_step"] == "greeting"
 
+    def test_step_configs_are_built_per_call(self, setup_workflow):
+        """Test mutating returned step configs does not affect later calls."""
+        from src.services.workflow import WorkflowService
+
+        configs = WorkflowService.get_step_configs("test_onboarding")
+        configs["greeting"]["agent"] = "coordinator"
+        del configs["discovery"]
+
+        fresh = WorkflowService.get_step_configs("test_onboarding")
+        assert fresh["greeting"]["agent"] == "greeter"
+        assert "discovery" in fresh
+
 
 class TestWorkflowProgressEndpoint:
     """Tests for workflow progress response model."""
@@ -381,5 +409,149 @@ class TestAgentConfigs:
             assert config.system_prompt, f"Agent {agent_name} missing system_prompt"
 
 
+class TestOnboardingWorkflowReplay:
+    """Replay tests for the workflow.patched branches in OnboardingWorkflow."""
+
+    @asynccontextmanager
+    async def _environment(self):
+        """Start the time-skipping test server, skipping when it cannot be downloaded."""
+        from temporalio.testing import WorkflowEnvironment
+
+        try:
+            env = await WorkflowEnvironment.start_time_skipping()
+        except Exception as e:  # e.g. offline: the ephemeral server binary is downloaded
+            pytest.skip(f"Temporal test server unavailable: {e}")
+        async with env:
+            yield env
+
+    async def _record_history(self, env, workflow_id: str, patches: bool):
+        """
+        Run one non-streaming turn against stub activities and return its history.
+
+        With patches=False, workflow.patched() returns False inside the
+        onboarding module only, reproducing the code before the patches.
+        """
+        import asyncio
+        import uuid
+
+        from temporalio import activity, workflow
+        from temporalio.worker import UnsandboxedWorkflowRunner, Worker
+
+        from src.temporal.activities import AgentResult
+        from src.temporal.workflows import onboarding
+        from src.temporal.workflows.onboarding import OnboardingWorkflow, UserMessage
+
+        turn_done = asyncio.Event()
+
+        @activity.defn(name="get_step_configs")
+        async def get_step_configs(workflow_name: str) -> dict:
+            return {}
+
+        @activity.defn(name="create_workflow_instance")
+        async def create_workflow_instance(input) -> str:
+            return "instance-1"
+
+        @activity.defn(name="get_or_create_conversation")
+        async def get_or_create_conversation(user_id: str, instance_id: str) -> str:
+            return "conv-1"
+
+        @activity.defn(name="notify_user")
+        async def notify_user(input) -> bool:
+            return True
+
+        @activity.defn(name="save_message")
+        async def save_message(input) -> str:
+            return "msg-1"
+
+        @activity.defn(name="search_memories")
+        async def search_memories(input) -> list:
+            return ["likes tea"]
+
+        @activity.defn(name="get_user_collections")
+        async def get_user_collections(user_id: str) -> list:
+            return []
+
+        @activity.defn(name="run_workflow_agent")
+        async def run_workflow_agent(input) -> AgentResult:
+            return AgentResult(content="Hi!", workflow_signal={"action": "stay"})
+
+        @activity.defn(name="add_memory")
+        async def add_memory(input) -> list:
+            turn_done.set()
+            return []
+
+        class PrePatchWorkflow:
+            """temporalio.workflow with every patch reported as absent."""
+
+            def __getattr__(self, name):
+                return getattr(workflow, name)
+
+            @staticmethod
+            def patched(patch_id: str) -> bool:
+                return False
+
+        pre_patch = (
+            nullcontext() if patches else patch.object(onboarding, "workflow", PrePatchWorkflow())
+        )
+        task_queue = f"replay-{uuid.uuid4()}"
+        with pre_patch:
+            async with Worker(
+                env.client,
+                task_queue=task_queue,
+                workflows=[OnboardingWorkflow],
+                activities=[
+                    get_step_configs,
+                    create_workflow_instance,
+                    get_or_create_conversation,
+                    notify_user,
+                    save_message,
+                    search_memories,
+                    get_user_collections,
+                    run_workflow_agent,
+                    add_memory,
+                ],
+                # Runs on the real module globals, so the pre-patch override applies
+                workflow_runner=UnsandboxedWorkflowRunner(),
+            ):
+                handle = await env.client.start_workflow(
+                    OnboardingWorkflow.run,
+                    args=["user-1", {}],
+                    id=workflow_id,
+                    task_queue=task_queue,
+                )
+                await handle.signal(OnboardingWorkflow.user_message, UserMessage(content="hello"))
+                await asyncio.wait_for(turn_done.wait(), timeout=30)
+                # Query round-trip: the turn's last workflow task is recorded
+                await handle.query(OnboardingWorkflow.get_state)
+                history = await handle.fetch_history()
+                await handle.terminate()
+        return history
+
+    @pytest.mark.asyncio
+    async def test_replays_history_recorded_before_patches(self):
+        """Test histories from the sequential code still replay deterministically."""
+        from temporalio.worker import Replayer
+
+        from src.temporal.workflows.onboarding import OnboardingWorkflow
+
+        async with self._environment() as env:
+            history = await self._record_history(env, "onboarding-pre-patch", patches=False)
+
+        assert not any(event.HasField("marker_recorded_event_attributes") for event in history.events)
+        await Replayer(workflows=[OnboardingWorkflow]).replay_workflow(history)
+
+    @pytest.mark.asyncio
+    async def test_replays_history_recorded_with_patches(self):
+        """Test histories from the concurrent code replay deterministically."""
+        from temporalio.worker import Replayer
+
+        from src.temporal.workflows.onboarding import OnboardingWorkflow
+
+        async with self._environment() as env:
+            history = await self._record_history(env, "onboarding-patched", patches=True)
+
+        assert any(event.HasField("marker_recorded_event_attributes") for event in history.events)
+        await Replayer(workflows=[OnboardingWorkflow]).replay_workflow(history)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
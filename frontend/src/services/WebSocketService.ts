@@ -247,19 +247,29 @@ class WebSocketServiceImpl {
       const message = JSON.parse(event.data);
       console.log("[WebSocket] Received message:", message);
 
-      // Route streaming events to StreamObserver
-      if (isStreamEvent(message)) {
-        this._streamObserver.dispatch(message as StreamEvent);
+      // Server coalesces bursts into {"type": "batch", "events": [...]}
+      if (message.type === "batch" && Array.isArray(message.events)) {
+        message.events.forEach((item: unknown) => this.dispatchMessage(item));
         return;
       }
 
-      // Route control messages (thinking, status) to handlers
-      this.notifyMessageHandlers(message as IncomingMessage);
+      this.dispatchMessage(message);
     } catch (error) {
       console.error("[WebSocket] Failed to parse message:", error);
     }
   }
 
+  private dispatchMessage(message: unknown): void {
+    // Route streaming events to StreamObserver
+    if (isStreamEvent(message)) {
+      this._streamObserver.dispatch(message as StreamEvent);
+      return;
+    }
+
+    // Route control messages (thinking, status) to handlers
+    this.notifyMessageHandlers(message as IncomingMessage);
+  }
+
   private notifyMessageHandlers(message: IncomingMessage): void {
     this.messageHandlers.forEach((handler) => {
       try {